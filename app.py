@@ -7,7 +7,7 @@ from pathlib import Path
 import json
 from dataclasses import dataclass
 from datetime import date
-from typing import Dict, Tuple, List, Any, Optional
+from typing import Dict, Tuple, List, Any, Optional, Iterable
 
 import pandas as pd
 import streamlit as st
@@ -203,6 +203,14 @@ def _hash_bytes(b: bytes) -> str:
     import hashlib as _hl
     return _hl.sha256(b).hexdigest()
 
+def _hash_chunks(chunks: Iterable[bytes]) -> str:
+    """Same digest as _hash_bytes(b"".join(chunks)), without building the joined copy."""
+    import hashlib as _hl
+    h = _hl.sha256()
+    for chunk in chunks:
+        h.update(chunk)
+    return h.hexdigest()
+
 def _ensure_col(df: pd.DataFrame, col: str, default: Any = ""):
     """Ensure a column exists and fill NA."""
     if col not in df.columns:
@@ -1187,7 +1195,7 @@ def main():
     if draft_files:
         # Calculate hash of uploaded files to detect if they've changed
         file_contents = [f.getvalue() for f in draft_files]
-        uploaded_files_hash = _hash_bytes(b"".join(file_contents))
+        uploaded_files_hash = _hash_chunks(file_contents)
         
         # Process the files (always process on first upload, or if hash changed)
         # But skip if we're in the middle of conflict resolution
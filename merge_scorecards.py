@@ -15,6 +15,7 @@ from __future__ import annotations
 from dataclasses import dataclass, field
 from typing import Any, Dict, List, Optional, Tuple, Union
 from enum import Enum
+from functools import lru_cache
 import copy
 import csv
 import io
@@ -99,6 +100,21 @@ class QuestionRegistry:
             with open(path, 'rb') as f:
                 self.load_from_csv_bytes(f.read())
     
+    @classmethod
+    def from_csv_file(cls, file_path: Union[str, Path]) -> "QuestionRegistry":
+        """
+        Shared registry for a CSV file, parsed once per version of the file.
+        
+        Cached by path, modification time and size, so the returned registry
+        is shared between callers and must be treated as read-only.
+        """
+        path = Path(file_path)
+        try:
+            st = path.stat()
+        except OSError:
+            return cls()  # Missing file: empty registry, same as load_from_csv_file
+        return _cached_registry(str(path), st.st_mtime_ns, st.st_size)
+    
     def load_from_dataframe(self, df: Any) -> None:
         """Load questions from a pandas DataFrame."""
         try:
@@ -138,6 +154,14 @@ class QuestionRegistry:
         return question_id in self._questions
 
 
+@lru_cache(maxsize=8)
+def _cached_registry(path: str, mtime_ns: int, size: int) -> QuestionRegistry:
+    # mtime_ns and size are only part of the cache key, so an edited file is re-read
+    registry = QuestionRegistry()
+    registry.load_from_csv_file(path)
+    return registry
+
+
 # Field label mappings for common subfields
 FIELD_LABEL_MAP: Dict[str, str] = {
     'primary': 'Primary answer',
@@ -151,26 +175,25 @@ FIELD_LABEL_MAP: Dict[str, str] = {
 }
 
 
+# camelCase word boundary, e.g. "someKey" -> "some Key"
+_CAMEL_CASE_RE = re.compile(r'([a-z])([A-Z])')
+
+
+@lru_cache(maxsize=4096)
 def _humanize_key(key: str) -> str:
     """Convert an internal key to a human-readable form (fallback)."""
     # Replace underscores with spaces and title-case
     result = key.replace('_', ' ').replace('-', ' ')
     # Handle camelCase
-    result = re.sub(r'([a-z])([A-Z])', r'\1 \2', result)
+    result = _CAMEL_CASE_RE.sub(r'\1 \2', result)
     return result.title()
 
 
-def _extract_question_id_from_path(section: str, key: str) -> Optional[str]:
-    """
-    Extract question ID from conflict section/key.
-    
-    Examples:
-        - section="answers.COMM_REC_Q2a", key="primary" -> "COMM_REC_Q2a"
-        - section="answers", key="COMM_REC_Q2a" -> "COMM_REC_Q2a"
-        - section="per_show_answers.Show1.ATI01", key="primary" -> "ATI01"
-    """
-    # Common question ID prefixes
-    qid_patterns = [
+# Common question ID shapes, compiled once. Tried in this order, so an
+# earlier pattern wins even if a later one matches further left.
+_QID_PATTERNS = [
+    re.compile(pattern, re.IGNORECASE)
+    for pattern in (
         r'\b(ATI\d+\w*)\b',
         r'\b(ACSI\d+\w*)\b',
         r'\b(CR\d+\w*)\b',
@@ -180,17 +203,29 @@ def _extract_question_id_from_path(section: str, key: str) -> Optional[str]:
         r'\b(COMM_\w+_Q\d+\w*)\b',
         r'\b(CORP_\w+_?Q?\d*\w*)\b',
         r'\b(SCH_\w+_Q\d+\w*)\b',
-    ]
+    )
+]
+
+
+@lru_cache(maxsize=4096)
+def _extract_question_id_from_path(section: str, key: str) -> Optional[str]:
+    """
+    Extract question ID from conflict section/key.
     
+    Examples:
+        - section="answers.COMM_REC_Q2a", key="primary" -> "COMM_REC_Q2a"
+        - section="answers", key="COMM_REC_Q2a" -> "COMM_REC_Q2a"
+        - section="per_show_answers.Show1.ATI01", key="primary" -> "ATI01"
+    """
     # Try to find question ID in section path
-    for pattern in qid_patterns:
-        match = re.search(pattern, section, re.IGNORECASE)
+    for pattern in _QID_PATTERNS:
+        match = pattern.search(section)
         if match:
             return match.group(1)
     
     # Try in key
-    for pattern in qid_patterns:
-        match = re.search(pattern, key, re.IGNORECASE)
+    for pattern in _QID_PATTERNS:
+        match = pattern.search(key)
         if match:
             return match.group(1)
     
@@ -232,7 +267,8 @@ def resolve_conflict_label(
     # Build the debug key
     debug_key = f"{section} › {key}" if section != key else key
     
-    # Default fallback values
+    # Default fallback values; field_label holds the mapped subfield label
+    # (e.g. "primary" -> "Primary answer") for every branch below
     section_label = "Answers"
     question_label = _humanize_key(key)
     field_label = FIELD_LABEL_MAP.get(key.lower(), "")
@@ -269,12 +305,9 @@ def resolve_conflict_label(
             # Try to derive section from question ID prefix
             section_label = _derive_section_from_qid(question_id)
         
-        # Determine field label from key if it's a subfield
-        if key.lower() in FIELD_LABEL_MAP:
-            field_label = FIELD_LABEL_MAP[key.lower()]
-        elif key != question_id:
-            # Key is something other than the question ID
-            field_label = FIELD_LABEL_MAP.get(key.lower(), _humanize_key(key))
+        # Unmapped keys other than the question ID itself get a humanized label
+        if not field_label and key != question_id:
+            field_label = _humanize_key(key)
     
     elif question_id:
         # No registry, but we found a question ID - do best effort
@@ -285,9 +318,6 @@ def resolve_conflict_label(
             section_label = show_name_from_path
         else:
             section_label = _derive_section_from_qid(question_id)
-        
-        if key.lower() in FIELD_LABEL_MAP:
-            field_label = FIELD_LABEL_MAP[key.lower()]
     
     else:
         # No question ID found - handle as generic path
@@ -302,12 +332,6 @@ def resolve_conflict_label(
                     section_label = f"Per-Show: {show_name}"
         elif section.startswith("answers"):
             section_label = "Answers"
-        
-        # Key might be the field name
-        if key.lower() in FIELD_LABEL_MAP:
-            field_label = FIELD_LABEL_MAP[key.lower()]
-        else:
-            question_label = _humanize_key(key)
     
     return ConflictLabel(
         section_label=section_label,
@@ -317,6 +341,38 @@ def resolve_conflict_label(
     )
 
 
+# Question-ID prefix -> section label, used when the registry has no
+# section info. Longer prefixes come before the shorter ones they extend
+# (COMM_REC_ before COMM_) so the first match is the most specific.
+_QID_SECTION_PREFIXES: Dict[str, str] = {
+    'COMM_ACCESS_': 'Community Access Programs',
+    'COMM_REC_': 'Recreational Classes',
+    'COMM_': 'Community',
+    'CORP_GP_': 'Global Presence',
+    'CORP_SU_': 'Subscriptions & Sales',
+    'CORP_CM_': 'Company Marketing',
+    'CORP_SM_': 'School Marketing',
+    'CORP_CU_': 'Community Marketing',
+    'CORP_LS_': 'Leadership & Culture',
+    'CORP_TB_': 'Team Building',
+    'CORP_PL_': 'Policies',
+    'CORP_WC_': 'Workplace Culture',
+    'CORP_BM_': 'Board Management',
+    'CORP_': 'Corporate',
+    'SCH_CT_': 'Classical Training',
+    'SCH_AS_': 'Attracting Students',
+    'SCH_SA_': 'Student Accessibility',
+    'SCH_': 'School',
+    'ATI': 'Artistic & Technical Innovation',
+    'ACSI': 'Artistic Contributions & Social Impact',
+    'CR': 'Collaborations & Residencies',
+    'RA': 'Recruitment & Auditions',
+    'FE': 'Festivals & Events',
+    'FM': 'Financials & Marketing',
+}
+
+
+@lru_cache(maxsize=4096)
 def _derive_section_from_qid(question_id: str) -> str:
     """
     Derive a section label from a question ID prefix.
@@ -325,35 +381,7 @@ def _derive_section_from_qid(question_id: str) -> str:
     """
     qid_upper = question_id.upper()
     
-    # Map prefixes to human-readable section names
-    prefix_map = {
-        'COMM_ACCESS_': 'Community Access Programs',
-        'COMM_REC_': 'Recreational Classes',
-        'COMM_': 'Community',
-        'CORP_GP_': 'Global Presence',
-        'CORP_SU_': 'Subscriptions & Sales',
-        'CORP_CM_': 'Company Marketing',
-        'CORP_SM_': 'School Marketing',
-        'CORP_CU_': 'Community Marketing',
-        'CORP_LS_': 'Leadership & Culture',
-        'CORP_TB_': 'Team Building',
-        'CORP_PL_': 'Policies',
-        'CORP_WC_': 'Workplace Culture',
-        'CORP_BM_': 'Board Management',
-        'CORP_': 'Corporate',
-        'SCH_CT_': 'Classical Training',
-        'SCH_AS_': 'Attracting Students',
-        'SCH_SA_': 'Student Accessibility',
-        'SCH_': 'School',
-        'ATI': 'Artistic & Technical Innovation',
-        'ACSI': 'Artistic Contributions & Social Impact',
-        'CR': 'Collaborations & Residencies',
-        'RA': 'Recruitment & Auditions',
-        'FE': 'Festivals & Events',
-        'FM': 'Financials & Marketing',
-    }
-    
-    for prefix, label in prefix_map.items():
+    for prefix, label in _QID_SECTION_PREFIXES.items():
         if qid_upper.startswith(prefix):
             return label
     
@@ -538,12 +566,10 @@ def merge_scorecards(
         
         # Merge per_show_answers
         if "per_show_answers" in scorecard_data and scorecard_data["per_show_answers"]:
+            merged_shows = merged["per_show_answers"]
             for show_key, show_answers in scorecard_data["per_show_answers"].items():
-                if show_key not in merged["per_show_answers"]:
-                    merged["per_show_answers"][show_key] = {}
-                
                 merge_nested_dict(
-                    merged["per_show_answers"][show_key],
+                    merged_shows.setdefault(show_key, {}),
                     show_answers,
                     source_name,
                     conflicts,
@@ -606,6 +632,25 @@ def format_conflicts_for_display(
     return "\n".join(lines)
 
 
+def _writable_child(parent: Dict[str, Any], key: str, copied: set, create: bool = False) -> Any:
+    """
+    Return parent[key] as a container owned by the result being built.
+    
+    The child is shallow-copied the first time it is written through; `copied`
+    holds the ids of containers that already belong to the result. With
+    `create`, a missing key gets a new empty dict.
+    """
+    if create and key not in parent:
+        parent[key] = {}
+        copied.add(id(parent[key]))
+    child = parent[key]
+    if id(child) not in copied:
+        child = copy.copy(child)
+        parent[key] = child
+        copied.add(id(child))
+    return child
+
+
 def apply_conflict_resolutions(
     merged_data: Dict[str, Any],
     conflicts: List[Conflict],
@@ -623,7 +668,10 @@ def apply_conflict_resolutions(
     Returns:
         Updated merged data with conflicts resolved
     """
-    result = copy.deepcopy(merged_data)
+    # Copy-on-write: only the containers along each resolved path are copied;
+    # everything else is shared with merged_data, which is left untouched
+    result = dict(merged_data)
+    copied = {id(result)}
     
     for conflict_idx, value_idx in resolutions.items():
         if conflict_idx >= len(conflicts):
@@ -641,11 +689,9 @@ def apply_conflict_resolutions(
             keys = conflict.section.split(".")[1:] + [conflict.key]
             
             # Navigate to the nested location
-            current = result.get("answers", {})
+            current = _writable_child(result, "answers", copied) if "answers" in result else {}
             for key in keys[:-1]:
-                if key not in current:
-                    current[key] = {}
-                current = current[key]
+                current = _writable_child(current, key, copied, create=True)
             
             # Set the chosen value
             if keys:
@@ -662,11 +708,10 @@ def apply_conflict_resolutions(
                     remaining_keys = parts[2:] if len(parts) > 2 else []
                     remaining_keys.append(conflict.key)
                     
-                    current = result["per_show_answers"][show_key]
+                    shows = _writable_child(result, "per_show_answers", copied)
+                    current = _writable_child(shows, show_key, copied)
                     for key in remaining_keys[:-1]:
-                        if key not in current:
-                            current[key] = {}
-                        current = current[key]
+                        current = _writable_child(current, key, copied, create=True)
                     
                     if remaining_keys:
                         current[remaining_keys[-1]] = chosen_value
@@ -674,6 +719,6 @@ def apply_conflict_resolutions(
         else:
             # Generic handling for other sections
             if conflict.key in result.get(conflict.section, {}):
-                result[conflict.section][conflict.key] = chosen_value
+                _writable_child(result, conflict.section, copied)[conflict.key] = chosen_value
     
     return result
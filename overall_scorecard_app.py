@@ -9,7 +9,7 @@
 #   - Shows a simple table of which departments/months you’ve loaded
 #   - Calls ai_utils.interpret_overall_scorecards(...) for the AI summary
 #   - Lets you EDIT the AI text before exporting
-#   - Uses pdf_utils.build_overall_board_pdf(...) to create a Board PDF
+#   - Uses pdf_utils.build_overall_board_pdf_stream(...) to create a Board PDF
 
 from __future__ import annotations
 
@@ -21,7 +21,7 @@ import streamlit as st
 from PyPDF2 import PdfReader
 
 from ai_utils import interpret_overall_scorecards
-from pdf_utils import build_overall_board_pdf
+from pdf_utils import build_overall_board_pdf_stream
 from docx_utils import build_overall_board_docx
 
 JSON_PREFIX = "AB_SCORECARD_JSON:"
@@ -415,7 +415,7 @@ else:
     col1, col2 = st.columns(2)
     
     with col1:
-        pdf_bytes = build_overall_board_pdf(
+        pdf_stream = build_overall_board_pdf_stream(
             reporting_label=reporting_label,
             dept_overview=df_overview,
             ai_result=ai_result,
@@ -424,7 +424,7 @@ else:
 
         st.download_button(
             label="📄 Download Board Report PDF",
-            data=pdf_bytes,
+            data=pdf_stream,
             file_name=f"overall_board_report_{reporting_label.replace(' ', '_')}.pdf",
             mime="application/pdf",
         )
@@ -2,12 +2,21 @@
 
 from __future__ import annotations
 
+from concurrent.futures import ProcessPoolExecutor
 from io import BytesIO
-from typing import Dict, Any
+from typing import Any, BinaryIO, Dict, Iterable, Iterator
 from datetime import datetime
+from functools import lru_cache
+import copy
 import json
+import os
 import re
 
+try:
+    import orjson  # optional: faster JSON for dict-valued AI fields
+except ImportError:
+    orjson = None
+
 import pandas as pd
 from xml.sax.saxutils import escape as xml_escape
 
@@ -15,6 +24,7 @@ from reportlab.lib import colors
 from reportlab.lib.pagesizes import LETTER
 from reportlab.lib.styles import getSampleStyleSheet, ParagraphStyle
 from reportlab.lib.units import inch
+from reportlab.pdfbase.pdfmetrics import stringWidth
 from reportlab.platypus import (
     Flowable,
     Image,
@@ -30,6 +40,21 @@ from app_config import OBJECTIVES_DF
 
 JSON_PREFIX = "AB_SCORECARD_JSON:"
 
+# Blank-line paragraph separator, tolerant of Windows line endings
+_PARA_SPLIT = re.compile(r"(?:\r?\n){2,}")
+
+# score_hint forms: "2/3", "1.5 / 3", or a bare number on the 0–3 scale
+_SCORE_FRAC_RE = re.compile(r"(\d+(?:\.\d+)?)\s*/\s*(\d+(?:\.\d+)?)")
+_SCORE_NUM_RE = re.compile(r"(\d+(?:\.\d+)?)")
+
+# Objective codes ("ART1", "(ART1)", leading "ART1: ") and text clean-up
+_ART_LEADING_RE = re.compile(r"^\s*\(?ART[0-9]+\)?\s*:\s*")
+_ART_PAREN_RE = re.compile(r"\(ART[0-9]+\)")
+_ART_BARE_RE = re.compile(r"\bART[0-9]+\b")
+_MULTI_SPACE_RE = re.compile(r"\s{2,}")
+_BLANK_LINE_RE = re.compile(r"\n\s*\n")
+_SENTENCE_SPLIT_RE = re.compile(r"(?<=[.!?])\s+(?=[A-Z])")
+
 # ─────────────────────────────────────────────────────────────────────────────
 # Helper text utilities
 # ─────────────────────────────────────────────────────────────────────────────
@@ -37,21 +62,63 @@ def _to_plain_text(val: Any) -> str:
     """
     Normalise various AI output types to a human-readable string.
     """
+    # Exact-type checks first: AI output is almost always a str or a list of str
+    t = type(val)
+    if t is str:
+        return val
     if val is None:
         return ""
+    if t is list and all(type(v) is str for v in val):
+        return "\n\n".join(val)
     if isinstance(val, str):
         return val
     if isinstance(val, list):
-        return "\n\n".join(_to_plain_text(v) for v in val)
+        return "\n\n".join(map(_to_plain_text, val))
     if isinstance(val, dict):
-        if "text" in val and isinstance(val["text"], str):
-            return val["text"]
+        text = val.get("text")
+        if isinstance(text, str):
+            return text
+        if "primary" in val:
+            return _format_response_dict(val)
+        if orjson is not None:
+            try:
+                dumped = orjson.dumps(
+                    val, option=orjson.OPT_INDENT_2 | orjson.OPT_NON_STR_KEYS
+                )
+                # orjson writes NaN/Infinity as null; let stdlib json keep them
+                if b"null" not in dumped:
+                    return dumped.decode("utf-8")
+            except TypeError:
+                pass  # types orjson rejects fall through to stdlib json
         try:
             return json.dumps(val, ensure_ascii=False, indent=2)
         except Exception:
             return str(val)
     return str(val)
 
+def _format_response_dict(d: Dict[str, Any]) -> str:
+    """
+    Render a {"primary": ..., "description": ...} response as one string.
+
+    Gives "primary — description", or whichever part is present on its own.
+    """
+    primary = d.get("primary", "")
+    desc = d.get("description", "")
+    if desc:
+        desc = str(desc)
+        if primary:
+            return f"{primary} — {desc}"
+        return desc
+    return str(primary)
+
+
+def _format_response(raw_val: Any) -> str:
+    """Render one stored response value (dict, scalar or None) as text."""
+    if isinstance(raw_val, dict):
+        return _format_response_dict(raw_val)
+    return "" if raw_val is None else str(raw_val)
+
+
 def _build_embed_payload(
     meta: Dict[str, Any],
     questions_df: pd.DataFrame,
@@ -140,14 +207,31 @@ def _safe_paragraph(text: Any, style: ParagraphStyle, allow_markup: bool = False
     """
     Create a Paragraph that won't blow up if the text contains '<', '>' or '&'.
     """
-    if text is None:
-        text = ""
-    s = _to_plain_text(text)
-    if not allow_markup:
+    # Plain strings (the common case) skip normalisation entirely
+    s = text if type(text) is str else _to_plain_text(text)
+    # Most labels and answers contain no XML specials; skip the escape copies
+    if not allow_markup and ("&" in s or "<" in s or ">" in s):
         s = xml_escape(s)
     return Paragraph(s, style)
 
 
+@lru_cache(maxsize=1024)
+def _parsed_paragraph(text: str, style: ParagraphStyle) -> Paragraph:
+    return Paragraph(text, style)
+
+
+def _cached_paragraph(text: str, style: ParagraphStyle) -> Paragraph:
+    """
+    Paragraph for text that repeats across builds (headings, labels, bullets).
+
+    The markup is parsed once per (text, style); each call gets a shallow copy
+    because a Paragraph keeps its own layout state once it has been wrapped.
+    Only use with styles from the shared stylesheet.
+    """
+    return copy.copy(_parsed_paragraph(text, style))
+
+
+@lru_cache(maxsize=1024)
 def _strip_objective_codes(text: str) -> str:
     """
     Remove internal objective codes like ART1 / (ART1) and
@@ -155,29 +239,49 @@ def _strip_objective_codes(text: str) -> str:
 
     Also strips any leading colon+space left behind when the code is
     at the start of the string (e.g. 'ART1: Title' -> 'Title').
+
+    Cached because the same pillar names, titles and bullets pass through
+    here once per report section.
     """
     if not text:
         return ""
 
     s = text
 
-    # If the code is at the start, strip it AND any following colon/whitespace
-    # e.g. "ART1: Elevate..." or "(ART1): Elevate..." -> "Elevate..."
-    s = re.sub(r"^\s*\(?ART[0-9]+\)?\s*:\s*", "", s)
+    # Most text carries no codes at all, so skip the three regex passes
+    if "ART" in s:
+        # If the code is at the start, strip it AND any following colon/whitespace
+        # e.g. "ART1: Elevate..." or "(ART1): Elevate..." -> "Elevate..."
+        s = _ART_LEADING_RE.sub("", s)
 
-    # Remove "(ART1)" style codes anywhere else
-    s = re.sub(r"\(ART[0-9]+\)", "", s)
+        # Remove "(ART1)" style codes anywhere else
+        s = _ART_PAREN_RE.sub("", s)
 
-    # Remove bare ART1 / ART2 tokens elsewhere
-    s = re.sub(r"\bART[0-9]+\b", "", s)
+        # Remove bare ART1 / ART2 tokens elsewhere
+        s = _ART_BARE_RE.sub("", s)
 
     # Replace en-dash bullet fragments " – " with a space
     s = s.replace(" – ", " ")
 
     # Normalise excess whitespace
-    s = re.sub(r"\s{2,}", " ", s)
+    s = _MULTI_SPACE_RE.sub(" ", s)
     return s.strip()
 
+
+def _clean_text(val: Any) -> str:
+    """AI output value as trimmed plain text with objective codes stripped."""
+    return _strip_objective_codes(_to_plain_text(val).strip())
+
+def _clean_strings(items: Any) -> Iterator[str]:
+    """
+    Yield each item as plain text with objective codes stripped, skipping
+    items that end up empty. Each item is normalised exactly once.
+    """
+    for item in items or ():
+        txt = _strip_objective_codes(_to_plain_text(item))
+        if txt:
+            yield txt
+
 def _split_paragraphs(raw_value: Any) -> list[str]:
     """
     Split narrative into logical paragraphs.
@@ -189,31 +293,28 @@ def _split_paragraphs(raw_value: Any) -> list[str]:
     """
     # List case: treat each as paragraph
     if isinstance(raw_value, list):
-        paras: list[str] = []
-        for item in raw_value:
-            txt = _strip_objective_codes(_to_plain_text(item)).strip()
-            if txt:
-                paras.append(txt)
-        return paras
+        return list(_clean_strings(raw_value))
 
     # String case
     text = _strip_objective_codes(_to_plain_text(raw_value or "")).replace("\r\n", "\n")
     if not text.strip():
         return []
 
-    # Try blank-line split first
-    parts = [p.strip() for p in re.split(r"\n\s*\n", text) if p.strip()]
-    if len(parts) > 1:
-        return parts
-
-    # If we have single newlines, allow those to break paragraphs
+    # Both line-based splits need a newline; single-line text (the usual AI
+    # summary) goes straight to sentence chunking
     if "\n" in text:
+        # Try blank-line split first
+        parts = [p.strip() for p in _BLANK_LINE_RE.split(text) if p.strip()]
+        if len(parts) > 1:
+            return parts
+
+        # If we have single newlines, allow those to break paragraphs
         parts = [p.strip() for p in text.split("\n") if p.strip()]
         if len(parts) > 1:
             return parts
 
     # Fallback: sentence-based chunking (group ~3 sentences per paragraph)
-    sentences = re.split(r'(?<=[.!?])\s+(?=[A-Z])', text)
+    sentences = _SENTENCE_SPLIT_RE.split(text)
     sentences = [s.strip() for s in sentences if s.strip()]
     if len(sentences) <= 3:
         return [" ".join(sentences)] if sentences else []
@@ -233,20 +334,29 @@ def _split_paragraphs(raw_value: Any) -> list[str]:
 # ─────────────────────────────────────────────────────────────────────────────
 # Score utilities
 # ─────────────────────────────────────────────────────────────────────────────
-def _parse_score_hint(score_hint: str | None) -> float | None:
+def _parse_score_hint(score_hint: str | float | None) -> float | None:
     """Extract an approximate 0–3 score from a score_hint string."""
     if not score_hint:
         return None
-
-    text = str(score_hint)
-    frac_match = re.search(r"(\d+(?:\.\d+)?)\s*/\s*(\d+(?:\.\d+)?)", text)
+    # AI callers sometimes pass the score itself rather than a hint string
+    if isinstance(score_hint, (int, float)) and not isinstance(score_hint, bool):
+        if score_hint != score_hint:  # NaN
+            return None
+        return max(0.0, min(3.0, float(score_hint)))
+    return _parse_score_text(str(score_hint))
+
+
+@lru_cache(maxsize=512)
+def _parse_score_text(text: str) -> float | None:
+    # The same hint strings recur across the summary and detail tables
+    frac_match = _SCORE_FRAC_RE.search(text)
     if frac_match:
         num = float(frac_match.group(1))
         den = float(frac_match.group(2))
         if den != 0:
             return max(0.0, min(3.0, (num / den) * 3))
 
-    num_match = re.search(r"(\d+(?:\.\d+)?)", text)
+    num_match = _SCORE_NUM_RE.search(text)
     if num_match:
         value = float(num_match.group(1))
         return max(0.0, min(3.0, value))
@@ -254,15 +364,21 @@ def _parse_score_hint(score_hint: str | None) -> float | None:
     return None
 
 
+_SCORE_NONE_COLOUR = colors.Color(0.8, 0.82, 0.85)  # muted grey-blue
+_SCORE_HIGH_COLOUR = colors.Color(0.40, 0.67, 0.63)  # teal/green
+_SCORE_MID_COLOUR = colors.Color(0.93, 0.73, 0.39)  # amber
+_SCORE_LOW_COLOUR = colors.Color(0.91, 0.44, 0.32)  # coral red
+
+
 def _score_to_colour(score: float | None) -> colors.Color:
     """Return a background colour based on score performance."""
     if score is None:
-        return colors.Color(0.8, 0.82, 0.85)  # muted grey-blue
+        return _SCORE_NONE_COLOUR
     if score >= 2.5:
-        return colors.Color(0.40, 0.67, 0.63)  # teal/green
+        return _SCORE_HIGH_COLOUR
     if score >= 1.5:
-        return colors.Color(0.93, 0.73, 0.39)  # amber
-    return colors.Color(0.91, 0.44, 0.32)  # coral red
+        return _SCORE_MID_COLOUR
+    return _SCORE_LOW_COLOUR
 
 
 def _score_display(score: float | None) -> str:
@@ -272,57 +388,168 @@ def _score_display(score: float | None) -> str:
 
 
 # ─────────────────────────────────────────────────────────────────────────────
-# Tables
+# Styles
 # ─────────────────────────────────────────────────────────────────────────────
-def _responses_table(questions: pd.DataFrame, responses: Dict[str, Any], styles) -> Table:
+@lru_cache(maxsize=1)
+def _report_styles():
     """
-    Build a 3-column table of context / question / response with wrapped text.
-    Note: PDF uses portrait orientation; DOCX uses landscape for this table.
+    Build the shared stylesheet once per process.
+
+    Both the department scorecard and the Board PDF use these styles. The
+    builders only read from the sheet, so the same instance is safe to reuse
+    across builds.
     """
-    body_style = ParagraphStyle(
-        name="TableBody",
-        parent=styles["BodyText"],
-        fontName="Helvetica",
-        fontSize=8,
-        leading=10,
+    styles = getSampleStyleSheet()
+    styles.add(
+        ParagraphStyle(
+            name="ScorecardTitle",
+            parent=styles["Title"],
+            fontName="Helvetica-Bold",
+            fontSize=22,
+            leading=26,
+            spaceAfter=4,
+        )
     )
+    styles.add(
+        ParagraphStyle(
+            name="MetaLabel",
+            parent=styles["Normal"],
+            fontName="Helvetica",
+            textColor=colors.grey,
+            fontSize=9,
+            leading=11,
+            spaceAfter=1,
+        )
+    )
+    styles.add(
+        ParagraphStyle(
+            name="MetaValue",
+            parent=styles["BodyText"],
+            fontName="Helvetica",
+            fontSize=10,
+            leading=12,
+        )
+    )
+    styles.add(
+        ParagraphStyle(
+            name="SectionHeading",
+            parent=styles["Heading2"],
+            fontName="Helvetica-Bold",
+            fontSize=14,
+            spaceBefore=12,
+            spaceAfter=6,
+        )
+    )
+    styles.add(
+        ParagraphStyle(
+            name="SubHeading",
+            parent=styles["Heading3"],
+            fontName="Helvetica-Bold",
+            fontSize=11,
+            leading=14,
+            spaceBefore=8,
+            spaceAfter=2,
+        )
+    )
+    styles.add(
+        ParagraphStyle(
+            name="SubHeadingSmall",
+            parent=styles["Heading4"],
+            fontName="Helvetica-Bold",
+            fontSize=9.5,
+            leading=12,
+            spaceBefore=4,
+            spaceAfter=1,
+        )
+    )
+    styles.add(
+        ParagraphStyle(
+            name="ScoreValue",
+            parent=styles["Title"],
+            fontName="Helvetica-Bold",
+            fontSize=14,
+            leading=16,
+        )
+    )
+    # Body style with explicit Helvetica (no italics)
+    styles.add(
+        ParagraphStyle(
+            name="ReportBody",
+            parent=styles["BodyText"],
+            fontName="Helvetica",
+            fontSize=10,
+            leading=13,
+        )
+    )
+    # ReportBody followed by a 4pt / 6pt gap before the next paragraph. The
+    # next paragraph's 6pt spaceBefore overlaps spaceAfter, hence gap + 6.
+    styles.add(
+        ParagraphStyle(
+            name="ReportBodyGap4",
+            parent=styles["ReportBody"],
+            spaceAfter=10,
+        )
+    )
+    styles.add(
+        ParagraphStyle(
+            name="ReportBodyGap6",
+            parent=styles["ReportBody"],
+            spaceAfter=12,
+        )
+    )
+    # Table cell styles
+    styles.add(
+        ParagraphStyle(
+            name="TableBody",
+            parent=styles["BodyText"],
+            fontName="Helvetica",
+            fontSize=8,
+            leading=10,
+        )
+    )
+    # Smaller font for score table details to fit better
+    styles.add(
+        ParagraphStyle(
+            name="DetailsCell",
+            parent=styles["BodyText"],
+            fontSize=8,
+            leading=10,
+        )
+    )
+    styles.add(
+        ParagraphStyle(
+            name="ObjectivesCell",
+            parent=styles["BodyText"],
+            fontSize=8,
+            leading=10,
+        )
+    )
+    styles.add(
+        ParagraphStyle(
+            name="ObjectivesHeaderCell",
+            parent=styles["BodyText"],
+            fontName="Helvetica-Bold",
+            fontSize=9,
+            leading=11,
+        )
+    )
+    return styles
 
-    data: list[list[Any]] = [
-        [
-            Paragraph("Pillar / Production / Metric", body_style),
-            Paragraph("Question", body_style),
-            Paragraph("Response", body_style),
-        ]
-    ]
-
-    for _, row in questions.sort_values("display_order").iterrows():
-        qid = row["question_id"]
-        qid_str = str(qid)
-
-        prod_label = row.get("production_title", "") or row.get("production", "")
-        label = f"{row.get('strategic_pillar', '')} / {prod_label} / {row.get('metric', '')}"
-        
-        # Get the question text
-        question_text = row.get("question_text", "") or row.get("metric", "") or ""
-        
-        raw_val = responses.get(qid_str, responses.get(qid, ""))
 
-        if isinstance(raw_val, dict):
-            primary = raw_val.get("primary", "")
-            desc = raw_val.get("description", "")
-            if desc:
-                value_str = f"{primary} — {desc}"
-            else:
-                value_str = str(primary)
-        else:
-            value_str = str(raw_val)
+# ─────────────────────────────────────────────────────────────────────────────
+# Tables
+# ─────────────────────────────────────────────────────────────────────────────
+# Portrait mode: ~7" usable width (8.5" - 1.5" margins)
+# Optimized for readability with text wrapping
+_RESPONSES_COLWIDTHS = [1.8 * inch, 2.2 * inch, 3.0 * inch]
 
-        label_p = Paragraph(xml_escape(label), body_style)
-        question_p = Paragraph(xml_escape(question_text), body_style)
-        value_p = Paragraph(xml_escape(value_str), body_style)
-        data.append([label_p, question_p, value_p])
+# Height to offer a cell when measuring it outside a frame
+_UNBOUNDED_HEIGHT = 1e6
 
-    style_cmds = [
+# Responses table style. ROWBACKGROUNDS stripes every data row with one
+# command, so the style no longer grows with the number of questions.
+_RESPONSES_STYLE = TableStyle(
+    [
         ("BACKGROUND", (0, 0), (-1, 0), colors.lightgrey),
         ("TEXTCOLOR", (0, 0), (-1, 0), colors.black),
         ("GRID", (0, 0), (-1, -1), 0.25, colors.grey),
@@ -331,21 +558,262 @@ def _responses_table(questions: pd.DataFrame, responses: Dict[str, Any], styles)
         ("RIGHTPADDING", (0, 0), (-1, -1), 4),
         ("TOPPADDING", (0, 0), (-1, -1), 2),
         ("BOTTOMPADDING", (0, 0), (-1, -1), 2),
+        ("ROWBACKGROUNDS", (0, 1), (-1, -1), [colors.whitesmoke, None]),
+    ]
+)
+
+# Board department overview table; Table.setStyle only reads the commands,
+# so one instance can be shared across builds.
+_DEPT_OVERVIEW_STYLE = TableStyle(
+    [
+        ("BACKGROUND", (0, 0), (-1, 0), colors.lightgrey),
+        ("FONTNAME", (0, 0), (-1, 0), "Helvetica-Bold"),
+        ("FONTSIZE", (0, 0), (-1, 0), 9),
+        ("BOTTOMPADDING", (0, 0), (-1, 0), 4),
+        ("ALIGN", (0, 0), (-1, 0), "LEFT"),
+
+        ("FONTNAME", (0, 1), (-1, -1), "Helvetica"),
+        ("FONTSIZE", (0, 1), (-1, -1), 9),
+        ("VALIGN", (0, 1), (-1, -1), "TOP"),
+
+        ("GRID", (0, 0), (-1, -1), 0.25, colors.grey),
+    ]
+)
+
+# Scorecard total score box; the score colours are prepended per build
+_TOTAL_TABLE_STYLE_CMDS = [
+    ("ALIGN", (0, 0), (-1, -1), "CENTER"),
+    ("VALIGN", (0, 0), (-1, -1), "MIDDLE"),
+    ("BOX", (0, 0), (-1, -1), 0.5, colors.grey),
+    ("TOPPADDING", (0, 0), (-1, -1), 3),
+    ("BOTTOMPADDING", (0, 0), (-1, -1), 4),
+    ("LEFTPADDING", (0, 0), (-1, -1), 6),
+    ("RIGHTPADDING", (0, 0), (-1, -1), 6),
+]
+
+# Scorecard header label/value block (department, reporting period)
+_META_TABLE_STYLE = TableStyle(
+    [
+        ("ALIGN", (0, 0), (-1, -1), "LEFT"),
+        ("VALIGN", (0, 0), (-1, -1), "TOP"),
+        ("BOTTOMPADDING", (0, 0), (-1, -1), 2),
+        ("LEFTPADDING", (0, 0), (-1, -1), 0),
+        ("RIGHTPADDING", (0, 0), (-1, -1), 6),
+    ]
+)
+
+# Scorecard title cell in the page header
+_TITLE_TABLE_STYLE = TableStyle(
+    [
+        ("ALIGN", (0, 0), (-1, -1), "LEFT"),
+        ("LEFTPADDING", (0, 0), (-1, -1), 0),
+        ("RIGHTPADDING", (0, 0), (-1, -1), 0),
+        ("BOTTOMPADDING", (0, 0), (-1, -1), 2),
+    ]
+)
+
+# Scorecard page header: logo | title | total score
+_SCORECARD_HEADER_STYLE = TableStyle(
+    [
+        ("VALIGN", (0, 0), (-1, -1), "TOP"),
+        ("BOTTOMPADDING", (0, 0), (-1, -1), 6),
+        ("LEFTPADDING", (0, 0), (0, 0), -4),
+        ("RIGHTPADDING", (0, 0), (0, 0), 6),
+        ("LEFTPADDING", (1, 0), (1, 0), 0),
+        ("RIGHTPADDING", (1, 0), (1, 0), 12),
+        ("LEFTPADDING", (2, 0), (2, 0), 6),
+        ("RIGHTPADDING", (2, 0), (2, 0), 0),
     ]
+)
 
-    for i in range(1, len(data)):
-        if i % 2 == 1:
-            style_cmds.append(("BACKGROUND", (0, i), (-1, i), colors.whitesmoke))
+# Board page header: logo | title
+_BOARD_HEADER_STYLE = TableStyle(
+    [
+        ("VALIGN", (0, 0), (-1, -1), "MIDDLE"),
+        ("LEFTPADDING", (0, 0), (0, 0), -4),
+        ("RIGHTPADDING", (0, 0), (0, 0), 6),
+        ("LEFTPADDING", (1, 0), (1, 0), 0),
+        ("RIGHTPADDING", (1, 0), (1, 0), 0),
+        ("BOTTOMPADDING", (0, 0), (-1, -1), 4),
+    ]
+)
+
+# Appendix A strategic objectives index
+_OBJECTIVES_INDEX_STYLE = TableStyle(
+    [
+        ("BACKGROUND", (0, 0), (-1, 0), colors.lightgrey),
+        ("TEXTCOLOR", (0, 0), (-1, 0), colors.black),
+        ("FONTNAME", (0, 0), (-1, 0), "Helvetica-Bold"),
+        ("FONTSIZE", (0, 0), (-1, 0), 9),
+        ("FONTSIZE", (0, 1), (-1, -1), 8),
+        ("VALIGN", (0, 0), (-1, -1), "TOP"),
+        ("ALIGN", (0, 0), (-1, -1), "LEFT"),
+        ("GRID", (0, 0), (-1, -1), 0.25, colors.grey),
+        ("LEFTPADDING", (0, 0), (-1, -1), 4),
+        ("RIGHTPADDING", (0, 0), (-1, -1), 4),
+        ("TOPPADDING", (0, 0), (-1, -1), 3),
+        ("BOTTOMPADDING", (0, 0), (-1, -1), 3),
+    ]
+)
+
+# Score tables (scorecard objectives, Board pillars): static commands shared
+# by both; each table appends its per-row score colours.
+_SCORE_TABLE_STYLE_CMDS = [
+    ("BACKGROUND", (0, 0), (-1, 0), colors.lightgrey),
+    ("TEXTCOLOR", (0, 0), (-1, 0), colors.black),
+    ("FONTNAME", (0, 0), (-1, 0), "Helvetica-Bold"),
+    ("FONTSIZE", (0, 0), (-1, 0), 9),
+    ("ALIGN", (0, 0), (-1, -1), "LEFT"),
+    ("VALIGN", (0, 0), (-1, -1), "TOP"),
+    ("GRID", (0, 0), (-1, -1), 0.5, colors.grey),
+    ("LEFTPADDING", (0, 0), (-1, -1), 6),
+    ("RIGHTPADDING", (0, 0), (-1, -1), 6),
+    ("TOPPADDING", (0, 0), (-1, -1), 4),
+    ("BOTTOMPADDING", (0, 0), (-1, -1), 4),
+]
+_OBJECTIVES_COLWIDTHS = [0.7 * inch, 1.8 * inch, 0.7 * inch, 1.2 * inch, 2.1 * inch]
+_PILLARS_COLWIDTHS = [0.7 * inch, 1.5 * inch, 0.7 * inch, 4.6 * inch]
+
+
+class _PlainCell(Flowable):
+    """
+    Single-line, markup-free table cell drawn straight onto the canvas.
+
+    Skips Paragraph's XML parsing and line-breaking for short text that
+    is known to fit its column. Positioned like a one-line Paragraph.
+    """
+
+    def __init__(
+        self,
+        text: str,
+        font: str,
+        size: float,
+        leading: float,
+        text_color: Any,
+        width: float,
+    ):
+        super().__init__()
+        self.text = text
+        self.font = font
+        self.size = size
+        self.leading = leading
+        self.text_color = text_color
+        self._text_width = width
+
+    def wrap(self, availWidth, availHeight):
+        return self._text_width, self.leading
+
+    def draw(self):
+        self.canv.setFont(self.font, self.size)
+        self.canv.setFillColor(self.text_color)
+        self.canv.drawString(0, self.leading - self.size, self.text)
+
+
+def _column_values(df: pd.DataFrame, col: str, default: Any = "") -> list[Any]:
+    """Return a column as a plain list, or `default` per row if it is missing."""
+    if col in df.columns:
+        return df[col].tolist()
+    return [default] * len(df)
+
+
+def _column_text(df: pd.DataFrame, col: str) -> pd.Series:
+    """Return a column as strings with missing values blank ("" if absent)."""
+    if col in df.columns:
+        return df[col].fillna("").astype(str)
+    return pd.Series("", index=df.index, dtype=object)
+
+
+def _index_responses(responses: Dict[str, Any]) -> Dict[str, Any]:
+    """
+    Key responses by stringified question_id so each row needs one lookup.
+
+    String keys win over non-string keys that stringify the same, matching
+    the old `responses.get(str(qid), responses.get(qid))` order.
+    """
+    by_qid = {str(k): v for k, v in responses.items() if not isinstance(k, str)}
+    by_qid.update((k, v) for k, v in responses.items() if isinstance(k, str))
+    return by_qid
+
+
+def _responses_table(questions: pd.DataFrame, responses: Dict[str, Any], styles=None) -> Table:
+    """
+    Build a 3-column table of context / question / response with wrapped text.
+    Note: PDF uses portrait orientation; DOCX uses landscape for this table.
+
+    `styles` defaults to the shared report stylesheet.
+    """
+    if styles is None:
+        styles = _report_styles()
+    body_style = styles["TableBody"]
+
+    header = [
+        Paragraph("Pillar / Production / Metric", body_style),
+        Paragraph("Question", body_style),
+        Paragraph("Response", body_style),
+    ]
+
+    # Column widths minus the 4pt left/right cell padding (rows add 2pt top/bottom)
+    label_avail, question_avail, value_avail = (w - 8 for w in _RESPONSES_COLWIDTHS)
+
+    def _text_cell(text: str, avail_width: float) -> Flowable:
+        # Text that fits on one line skips Paragraph parsing/layout entirely
+        plain = " ".join(text.split())
+        width = stringWidth(plain, body_style.fontName, body_style.fontSize)
+        if width <= avail_width:
+            return _PlainCell(
+                plain,
+                body_style.fontName,
+                body_style.fontSize,
+                body_style.leading,
+                body_style.textColor,
+                width,
+            )
+        return Paragraph(xml_escape(text), body_style)
+
+    # Pull the needed columns out once as plain lists; iterrows() would box
+    # every row into a Series. Missing columns behave like row.get(col, "").
+    q = questions.sort_values("display_order")
+    qid_strs = q["question_id"].astype(str).tolist()
+    metrics = _column_values(q, "metric")
+    question_texts = _column_values(q, "question_text")
+
+    # "Pillar / Production / Metric" labels as one column-wise string pass
+    prod_titles = _column_text(q, "production_title")
+    prod_labels = prod_titles.where(prod_titles != "", _column_text(q, "production"))
+    labels = (
+        _column_text(q, "strategic_pillar") + " / " + prod_labels + " / " + _column_text(q, "metric")
+    ).tolist()
+
+    resp_by_qid = _index_responses(responses)
+
+    data: list[list[Any]] = [header]
+    data.extend(
+        [
+            _text_cell(label, label_avail),
+            _text_cell(question_text or metric or "", question_avail),
+            _text_cell(_format_response(resp_by_qid.get(qid_str, "")), value_avail),
+        ]
+        for qid_str, label, metric, question_text in zip(
+            qid_strs, labels, metrics, question_texts
+        )
+    )
+
+    # Measure each row once up front. Without rowHeights, ReportLab re-wraps
+    # every remaining cell each time the table splits across a page.
+    cell_widths = (label_avail, question_avail, value_avail)
+    row_heights = [
+        max(cell.wrap(w, _UNBOUNDED_HEIGHT)[1] for cell, w in zip(row, cell_widths)) + 4
+        for row in data
+    ]
 
-    # Portrait mode: ~7" usable width (8.5" - 1.5" margins)
-    # Optimized for readability with text wrapping
     table = Table(
         data,
-        colWidths=[1.8 * inch, 2.2 * inch, 3.0 * inch],
+        colWidths=_RESPONSES_COLWIDTHS,
+        rowHeights=row_heights,
         repeatRows=1,
         hAlign="LEFT",
     )
-    table.setStyle(TableStyle(style_cmds))
+    table.setStyle(_RESPONSES_STYLE)
     return table
 
 def build_strategic_index_appendix():
@@ -354,11 +822,11 @@ def build_strategic_index_appendix():
     excluding the 'plan_anchor' column.
     Returns a list of ReportLab flowables (PageBreak + heading + table).
     """
-    styles = getSampleStyleSheet()
+    styles = _report_styles()
     heading_style = styles["Heading2"]
     body_style = styles["BodyText"]
 
-    df = OBJECTIVES_DF.copy()
+    df = OBJECTIVES_DF
 
     # If nothing is configured, return a simple notice instead
     if df.empty:
@@ -383,31 +851,19 @@ def build_strategic_index_appendix():
     header_labels = [col.replace("_", " ").title() for col in df.columns]
 
     # Smaller table style for readability
-    cell_style = ParagraphStyle(
-        name="ObjectivesCell",
-        parent=body_style,
-        fontSize=8,
-        leading=10,
-    )
-    header_style = ParagraphStyle(
-        name="ObjectivesHeaderCell",
-        parent=body_style,
-        fontName="Helvetica-Bold",
-        fontSize=9,
-        leading=11,
-    )
+    cell_style = styles["ObjectivesCell"]
+    header_style = styles["ObjectivesHeaderCell"]
 
     # Build header row with Paragraphs
     header = [Paragraph(xml_escape(label), header_style) for label in header_labels]
 
-    # Build data rows with Paragraphs so long text wraps
+    # Build data rows with Paragraphs so long text wraps. itertuples yields
+    # plain tuples, where iterrows() would box every row into a Series.
     data = [header]
-    for _, row in df.iterrows():
-        cells = []
-        for val in row.tolist():
-            text = "" if val is None else str(val)
-            cells.append(Paragraph(xml_escape(text), cell_style))
-        data.append(cells)
+    data.extend(
+        [Paragraph(xml_escape("" if val is None else str(val)), cell_style) for val in row]
+        for row in df.itertuples(index=False, name=None)
+    )
 
     table = Table(
         data,
@@ -419,26 +875,7 @@ def build_strategic_index_appendix():
         ][: len(df.columns)],  # trim if fewer columns
         repeatRows=1,
     )
-
-
-    table.setStyle(
-        TableStyle(
-            [
-                ("BACKGROUND", (0, 0), (-1, 0), colors.lightgrey),
-                ("TEXTCOLOR", (0, 0), (-1, 0), colors.black),
-                ("FONTNAME", (0, 0), (-1, 0), "Helvetica-Bold"),
-                ("FONTSIZE", (0, 0), (-1, 0), 9),
-                ("FONTSIZE", (0, 1), (-1, -1), 8),
-                ("VALIGN", (0, 0), (-1, -1), "TOP"),
-                ("ALIGN", (0, 0), (-1, -1), "LEFT"),
-                ("GRID", (0, 0), (-1, -1), 0.25, colors.grey),
-                ("LEFTPADDING", (0, 0), (-1, -1), 4),
-                ("RIGHTPADDING", (0, 0), (-1, -1), 4),
-                ("TOPPADDING", (0, 0), (-1, -1), 3),
-                ("BOTTOMPADDING", (0, 0), (-1, -1), 3),
-            ]
-        )
-    )
+    table.setStyle(_OBJECTIVES_INDEX_STYLE)
 
     return [
         PageBreak(),
@@ -447,6 +884,34 @@ def build_strategic_index_appendix():
         table,
     ]
 
+# ─────────────────────────────────────────────────────────────────────────────
+# Logo
+# ─────────────────────────────────────────────────────────────────────────────
+@lru_cache(maxsize=8)
+def _load_logo_bytes(path: str, mtime_ns: int, size: int) -> bytes:
+    # mtime_ns and size are only part of the cache key, so a replaced file is re-read
+    with open(path, "rb") as f:
+        return f.read()
+
+
+def _logo_image(logo_path: str | None) -> Image | None:
+    """
+    Header logo scaled to fit 2" x 2", or None if there is no usable logo.
+
+    The file is read once per modification time and size; each build gets
+    its own Image.
+    """
+    if not logo_path:
+        return None
+    try:
+        st = os.stat(logo_path)
+        img = Image(BytesIO(_load_logo_bytes(logo_path, st.st_mtime_ns, st.st_size)))
+        img._restrictSize(2 * inch, 2 * inch)
+        return img
+    except Exception:
+        return None
+
+
 # ─────────────────────────────────────────────────────────────────────────────
 # Main PDF builder
 # ─────────────────────────────────────────────────────────────────────────────
@@ -461,6 +926,33 @@ def build_scorecard_pdf(
     """
     Build and return the PDF as raw bytes.
 
+    See build_scorecard_pdf_stream for the layout and embedded payload.
+    """
+    # BytesIO.getvalue() hands back the internal buffer without copying it
+    return build_scorecard_pdf_stream(
+        meta,
+        questions,
+        responses,
+        ai_result,
+        logo_path=logo_path,
+        kpi_explanations=kpi_explanations,
+    ).getvalue()
+
+
+def build_scorecard_pdf_stream(
+    meta: Dict[str, Any],
+    questions: pd.DataFrame,
+    responses: Dict[str, Any],
+    ai_result: Dict[str, Any],
+    logo_path: str | None = None,
+    kpi_explanations: str | None = None,
+) -> BytesIO:
+    """
+    Build the PDF and return it as a BytesIO positioned at the start.
+
+    Hand the stream straight to a download/response helper (e.g.
+    st.download_button) instead of materialising a separate bytes copy.
+
     - Preserves your "Strategic Summary Scorecard" layout (header, executive summary,
       pillars, by production, risks/priorities, raw responses).
     - Embeds a JSON payload in the PDF metadata (Subject) including:
@@ -470,8 +962,36 @@ def build_scorecard_pdf(
       * overall_score and pillar_scores derived from pillar_summaries.
     """
     buffer = BytesIO()
-    doc = SimpleDocTemplate(
+    render_scorecard_pdf(
         buffer,
+        meta,
+        questions,
+        responses,
+        ai_result,
+        logo_path=logo_path,
+        kpi_explanations=kpi_explanations,
+    )
+    buffer.seek(0)
+    return buffer
+
+
+def render_scorecard_pdf(
+    fileobj: BinaryIO,
+    meta: Dict[str, Any],
+    questions: pd.DataFrame,
+    responses: Dict[str, Any],
+    ai_result: Dict[str, Any],
+    logo_path: str | None = None,
+    kpi_explanations: str | None = None,
+) -> None:
+    """
+    Write the scorecard PDF into `fileobj` (any writable binary file object).
+
+    Use this to write straight to a file or response stream without an
+    intermediate in-memory copy. Same arguments as build_scorecard_pdf.
+    """
+    doc = SimpleDocTemplate(
+        fileobj,
         pagesize=LETTER,
         rightMargin=36,
         leftMargin=36,
@@ -479,92 +999,7 @@ def build_scorecard_pdf(
         bottomMargin=36,
     )
 
-    styles = getSampleStyleSheet()
-
-    # ─────────────────────────────────────────────────────────────────────
-    # Styles (your originals)
-    # ─────────────────────────────────────────────────────────────────────
-    styles.add(
-        ParagraphStyle(
-            name="ScorecardTitle",
-            parent=styles["Title"],
-            fontName="Helvetica-Bold",
-            fontSize=22,
-            leading=26,
-            spaceAfter=4,
-        )
-    )
-    styles.add(
-        ParagraphStyle(
-            name="MetaLabel",
-            parent=styles["Normal"],
-            fontName="Helvetica",
-            textColor=colors.grey,
-            fontSize=9,
-            leading=11,
-            spaceAfter=1,
-        )
-    )
-    styles.add(
-        ParagraphStyle(
-            name="MetaValue",
-            parent=styles["BodyText"],
-            fontName="Helvetica",
-            fontSize=10,
-            leading=12,
-        )
-    )
-    styles.add(
-        ParagraphStyle(
-            name="SectionHeading",
-            parent=styles["Heading2"],
-            fontName="Helvetica-Bold",
-            fontSize=14,
-            spaceBefore=12,
-            spaceAfter=6,
-        )
-    )
-    styles.add(
-        ParagraphStyle(
-            name="SubHeading",
-            parent=styles["Heading3"],
-            fontName="Helvetica-Bold",
-            fontSize=11,
-            leading=14,
-            spaceBefore=8,
-            spaceAfter=2,
-        )
-    )
-    styles.add(
-        ParagraphStyle(
-            name="SubHeadingSmall",
-            parent=styles["Heading4"],
-            fontName="Helvetica-Bold",
-            fontSize=9.5,
-            leading=12,
-            spaceBefore=4,
-            spaceAfter=1,
-        )
-    )
-    styles.add(
-        ParagraphStyle(
-            name="ScoreValue",
-            parent=styles["Title"],
-            fontName="Helvetica-Bold",
-            fontSize=14,
-            leading=16,
-        )
-    )
-    # Body style with explicit Helvetica (no italics)
-    styles.add(
-        ParagraphStyle(
-            name="ReportBody",
-            parent=styles["BodyText"],
-            fontName="Helvetica",
-            fontSize=10,
-            leading=13,
-        )
-    )
+    styles = _report_styles()
 
     story: list[Flowable] = []
 
@@ -579,18 +1014,22 @@ def build_scorecard_pdf(
     # ─────────────────────────────────────────────────────────────────────
     objective_summaries = [ps for ps in (ai_result.get("objective_summaries") or ai_result.get("pillar_summaries") or []) if isinstance(ps, dict)]
 
-    score_values: list[float] = []
+    score_total = 0.0
+    score_count = 0
     pillar_score_map: Dict[str, float] = {}
     objective_score_map: Dict[str, float] = {}
 
-    for obj_sum in objective_summaries:
+    # Parsed once here and reused by the objectives table below
+    objective_scores = [_parse_score_hint(o.get("score_hint", "")) for o in objective_summaries]
+
+    for obj_sum, score_val in zip(objective_summaries, objective_scores):
         # Handle both old pillar structure and new objective structure
         obj_id = obj_sum.get("objective_id", "")
         pillar_key = _to_plain_text(obj_sum.get("strategic_pillar", "")).strip()
-        score_val = _parse_score_hint(obj_sum.get("score_hint", ""))
 
         if score_val is not None:
-            score_values.append(score_val)
+            score_total += score_val
+            score_count += 1
 
         # Map scores by both objective_id and pillar name for compatibility
         if obj_id and score_val is not None:
@@ -598,46 +1037,30 @@ def build_scorecard_pdf(
         if pillar_key and score_val is not None:
             pillar_score_map[pillar_key] = score_val
 
-    total_score = sum(score_values) / len(score_values) if score_values else None
+    total_score = score_total / score_count if score_count else None
 
     # ─────────────────────────────────────────────────────────────────────
     # Enrich questions with response_value + pillar_score for JSON payload
     # ─────────────────────────────────────────────────────────────────────
     questions_for_payload = questions.copy()
 
-    resp_values: list[str] = []
-    pillar_scores_for_rows: list[float | None] = []
-    overall_scores_for_rows: list[float | None] = []
-
-    for _, row in questions_for_payload.iterrows():
-        qid = row.get("question_id")
-        qid_str = str(qid)
-
-        raw_val = responses.get(qid_str, responses.get(qid, ""))
-
-        # Same normalisation logic as _responses_table
-        if isinstance(raw_val, dict):
-            primary = raw_val.get("primary", "")
-            desc = raw_val.get("description", "")
-            if desc:
-                if primary:
-                    value_str = f"{primary} — {desc}"
-                else:
-                    value_str = desc
-            else:
-                value_str = str(primary)
-        else:
-            value_str = "" if raw_val is None else str(raw_val)
+    resp_by_qid = _index_responses(responses)
 
-        resp_values.append(value_str)
+    # Column lists rather than iterrows(): no per-row Series, and no
+    # int -> float upcasting of question_id on all-numeric frames
+    qids = _column_values(questions_for_payload, "question_id", None)
+    pillar_keys = _column_values(questions_for_payload, "strategic_pillar")
 
-        # Match this question’s pillar to the pillar_score_map we built above
-        sp_key_raw = row.get("strategic_pillar", "")
-        sp_key = _to_plain_text(sp_key_raw).strip()
-        pillar_scores_for_rows.append(pillar_score_map.get(sp_key))
+    # Same normalisation logic as _responses_table
+    resp_values = [_format_response(resp_by_qid.get(str(qid), "")) for qid in qids]
+
+    # Match each question's pillar to the pillar_score_map we built above
+    pillar_scores_for_rows = [
+        pillar_score_map.get(_to_plain_text(sp_key).strip()) for sp_key in pillar_keys
+    ]
 
-        # Every row from this PDF shares the same overall_score
-        overall_scores_for_rows.append(total_score)
+    # Every row from this PDF shares the same overall_score
+    overall_scores_for_rows = [total_score] * len(questions_for_payload)
 
     questions_for_payload["response_value"] = resp_values
     questions_for_payload["pillar_score"] = pillar_scores_for_rows
@@ -671,20 +1094,14 @@ def build_scorecard_pdf(
 
     total_table = Table(
         [
-            [Paragraph("<b>Total score</b>", styles["MetaLabel"])],
+            [_cached_paragraph("<b>Total score</b>", styles["MetaLabel"])],
             [Paragraph(total_value, styles["ScoreValue"])],
         ],
         style=TableStyle(
             [
                 ("BACKGROUND", (0, 0), (-1, -1), total_colour),
                 ("TEXTCOLOR", (0, 0), (-1, -1), colors.white if total_score is not None else colors.black),
-                ("ALIGN", (0, 0), (-1, -1), "CENTER"),
-                ("VALIGN", (0, 0), (-1, -1), "MIDDLE"),
-                ("BOX", (0, 0), (-1, -1), 0.5, colors.grey),
-                ("TOPPADDING", (0, 0), (-1, -1), 3),
-                ("BOTTOMPADDING", (0, 0), (-1, -1), 4),
-                ("LEFTPADDING", (0, 0), (-1, -1), 6),
-                ("RIGHTPADDING", (0, 0), (-1, -1), 6),
+                *_TOTAL_TABLE_STYLE_CMDS,
             ]
         ),
         colWidths=[1.7 * inch],
@@ -694,11 +1111,11 @@ def build_scorecard_pdf(
     # Meta info: Department + Reporting period, left-aligned
     meta_rows = [
         [
-            Paragraph("DEPARTMENT", styles["MetaLabel"]),
+            _cached_paragraph("DEPARTMENT", styles["MetaLabel"]),
             Paragraph(str(department), styles["MetaValue"]),
         ],
         [
-            Paragraph("REPORTING PERIOD", styles["MetaLabel"]),
+            _cached_paragraph("REPORTING PERIOD", styles["MetaLabel"]),
             Paragraph(str(reporting_period) if reporting_period else "—", styles["MetaValue"]),
         ],
     ]
@@ -707,39 +1124,17 @@ def build_scorecard_pdf(
         meta_rows,
         colWidths=[1.9 * inch, 3.0 * inch],
         hAlign="LEFT",
-        style=TableStyle(
-            [
-                ("ALIGN", (0, 0), (-1, -1), "LEFT"),
-                ("VALIGN", (0, 0), (-1, -1), "TOP"),
-                ("BOTTOMPADDING", (0, 0), (-1, -1), 2),
-                ("LEFTPADDING", (0, 0), (-1, -1), 0),
-                ("RIGHTPADDING", (0, 0), (-1, -1), 6),
-            ]
-        ),
+        style=_META_TABLE_STYLE,
     )
 
     # Logo
-    logo_flowable: Flowable | None = None
-    if logo_path:
-        try:
-            img = Image(logo_path)
-            img._restrictSize(2 * inch, 2 * inch)
-            logo_flowable = img
-        except Exception:
-            logo_flowable = None
+    logo_flowable = _logo_image(logo_path)
 
     # Title block
     title_table = Table(
-        [[Paragraph("Strategic Summary Scorecard", styles["ScorecardTitle"])]],
+        [[_cached_paragraph("Strategic Summary Scorecard", styles["ScorecardTitle"])]],
         colWidths=[4.0 * inch],
-        style=TableStyle(
-            [
-                ("ALIGN", (0, 0), (-1, -1), "LEFT"),
-                ("LEFTPADDING", (0, 0), (-1, -1), 0),
-                ("RIGHTPADDING", (0, 0), (-1, -1), 0),
-                ("BOTTOMPADDING", (0, 0), (-1, -1), 2),
-            ]
-        ),
+        style=_TITLE_TABLE_STYLE,
     )
 
     header_cells: list[Flowable] = []
@@ -755,24 +1150,10 @@ def build_scorecard_pdf(
         [header_cells],
         colWidths=[2.0 * inch, 4.0 * inch, 1.5 * inch],
         hAlign="LEFT",
-        style=TableStyle(
-            [
-                ("VALIGN", (0, 0), (-1, -1), "TOP"),
-                ("BOTTOMPADDING", (0, 0), (-1, -1), 6),
-                ("LEFTPADDING", (0, 0), (0, 0), -4),
-                ("RIGHTPADDING", (0, 0), (0, 0), 6),
-                ("LEFTPADDING", (1, 0), (1, 0), 0),
-                ("RIGHTPADDING", (1, 0), (1, 0), 12),
-                ("LEFTPADDING", (2, 0), (2, 0), 6),
-                ("RIGHTPADDING", (2, 0), (2, 0), 0),
-            ]
-        ),
+        style=_SCORECARD_HEADER_STYLE,
     )
 
-    story.append(header_table)
-    story.append(Spacer(1, 6))
-    story.append(meta_table)
-    story.append(Spacer(1, 12))
+    story.extend([header_table, Spacer(1, 6), meta_table, Spacer(1, 12)])
 
     # ─────────────────────────────────────────────────────────────────────
     # Executive summary
@@ -780,41 +1161,51 @@ def build_scorecard_pdf(
     paragraphs = _split_paragraphs(overall_value)
 
     if paragraphs:
-        story.append(Paragraph("Executive Summary", styles["SectionHeading"]))
-        for idx, para in enumerate(paragraphs):
-            story.append(_safe_paragraph(para, styles["ReportBody"]))
-            if idx < len(paragraphs) - 1:
-                story.append(Spacer(1, 4))
+        story.append(_cached_paragraph("Executive Summary", styles["SectionHeading"]))
+        gap_style, body_style = styles["ReportBodyGap4"], styles["ReportBody"]
+        last = len(paragraphs) - 1
+        story.extend(
+            _safe_paragraph(para, gap_style if idx < last else body_style)
+            for idx, para in enumerate(paragraphs)
+        )
         story.append(Spacer(1, 10))
 
     # ─────────────────────────────────────────────────────────────────────
     # Strategic Objectives Score Table (with integrated details)
     # ─────────────────────────────────────────────────────────────────────
     if objective_summaries:
-        story.append(Paragraph("Strategic Objectives — Summary", styles["SectionHeading"]))
-        story.append(Spacer(1, 6))
+        story.extend([
+            _cached_paragraph("Strategic Objectives — Summary", styles["SectionHeading"]),
+            Spacer(1, 6),
+        ])
         
+        body_style = styles["BodyText"]
+        details_style = styles["DetailsCell"]
+
         # Build table data with Details column
         table_data = [
             [
-                Paragraph("<b>Objective ID</b>", styles["BodyText"]),
-                Paragraph("<b>Objective</b>", styles["BodyText"]),
-                Paragraph("<b>Score</b>", styles["BodyText"]),
-                Paragraph("<b>Status</b>", styles["BodyText"]),
-                Paragraph("<b>Details</b>", styles["BodyText"]),
+                _cached_paragraph("<b>Objective ID</b>", body_style),
+                _cached_paragraph("<b>Objective</b>", body_style),
+                _cached_paragraph("<b>Score</b>", body_style),
+                _cached_paragraph("<b>Status</b>", body_style),
+                _cached_paragraph("<b>Details</b>", body_style),
             ]
         ]
-        
-        for obj_sum in objective_summaries:
+
+        table_style_cmds = list(_SCORE_TABLE_STYLE_CMDS)
+
+        for i, (obj_sum, score_value) in enumerate(zip(objective_summaries, objective_scores), start=1):
             obj_id = obj_sum.get("objective_id", "")
             obj_title = obj_sum.get("objective_title", "") or obj_sum.get("strategic_pillar", "") or "Objective"
             score_hint_raw = _to_plain_text(obj_sum.get("score_hint", "")).strip()
-            
-            # Parse score
-            score_value = _parse_score_hint(score_hint_raw)
+
+            # The score drives both the cell text and its colour
             score_str = _score_display(score_value)
-            score_colour = _score_to_colour(score_value)
-            
+            table_style_cmds.append(("BACKGROUND", (2, i), (2, i), _score_to_colour(score_value)))
+            if score_value is not None and score_value >= 1.5:
+                table_style_cmds.append(("TEXTCOLOR", (2, i), (2, i), colors.white))
+
             # Extract status label from score_hint (e.g., "2/3 Steady progress" -> "Steady progress")
             status_label = score_hint_raw
             if "/" in score_hint_raw:
@@ -827,59 +1218,24 @@ def build_scorecard_pdf(
                         status_label = status_parts[1]
                     else:
                         status_label = score_hint_raw
-            
+
             # Get the summary text for the Details column
-            summary_text_raw = _to_plain_text(obj_sum.get("summary", "")).strip()
-            summary_text = _strip_objective_codes(summary_text_raw)
+            summary_text = _clean_text(obj_sum.get("summary", ""))
             if not summary_text:
                 summary_text = "No narrative summary provided for this objective."
-            
-            # Create table row
-            obj_id_cell = Paragraph(xml_escape(obj_id or "—"), styles["BodyText"])
-            obj_title_cell = Paragraph(xml_escape(_strip_objective_codes(obj_title)), styles["BodyText"])
-            score_cell = Paragraph(f"<b>{score_str} / 3</b>", styles["BodyText"])
-            status_cell = Paragraph(xml_escape(status_label), styles["BodyText"])
-            # Use smaller font for details to fit better
-            details_style = ParagraphStyle(
-                name="DetailsCell",
-                parent=styles["BodyText"],
-                fontSize=8,
-                leading=10,
-            )
-            details_cell = Paragraph(xml_escape(summary_text), details_style)
-            
-            table_data.append([obj_id_cell, obj_title_cell, score_cell, status_cell, details_cell])
-        
+
+            table_data.append([
+                Paragraph(xml_escape(obj_id or "—"), body_style),
+                Paragraph(xml_escape(_strip_objective_codes(obj_title)), body_style),
+                Paragraph(f"<b>{score_str} / 3</b>", body_style),
+                Paragraph(xml_escape(status_label), body_style),
+                Paragraph(xml_escape(summary_text), details_style),
+            ])
+
         # Create table with colored score cells, adjusted widths for 5 columns
-        obj_table = Table(table_data, colWidths=[0.7*inch, 1.8*inch, 0.7*inch, 1.2*inch, 2.1*inch])
-        
-        table_style_cmds = [
-            ("BACKGROUND", (0, 0), (-1, 0), colors.lightgrey),
-            ("TEXTCOLOR", (0, 0), (-1, 0), colors.black),
-            ("FONTNAME", (0, 0), (-1, 0), "Helvetica-Bold"),
-            ("FONTSIZE", (0, 0), (-1, 0), 9),
-            ("ALIGN", (0, 0), (-1, -1), "LEFT"),
-            ("VALIGN", (0, 0), (-1, -1), "TOP"),
-            ("GRID", (0, 0), (-1, -1), 0.5, colors.grey),
-            ("LEFTPADDING", (0, 0), (-1, -1), 6),
-            ("RIGHTPADDING", (0, 0), (-1, -1), 6),
-            ("TOPPADDING", (0, 0), (-1, -1), 4),
-            ("BOTTOMPADDING", (0, 0), (-1, -1), 4),
-        ]
-        
-        # Add colored backgrounds for score column
-        for i in range(1, len(table_data)):
-            obj_sum = objective_summaries[i - 1]
-            score_hint_raw = _to_plain_text(obj_sum.get("score_hint", "")).strip()
-            score_value = _parse_score_hint(score_hint_raw)
-            score_colour = _score_to_colour(score_value)
-            table_style_cmds.append(("BACKGROUND", (2, i), (2, i), score_colour))
-            if score_value is not None and score_value >= 1.5:
-                table_style_cmds.append(("TEXTCOLOR", (2, i), (2, i), colors.white))
-        
+        obj_table = Table(table_data, colWidths=_OBJECTIVES_COLWIDTHS)
         obj_table.setStyle(TableStyle(table_style_cmds))
-        story.append(obj_table)
-        story.append(Spacer(1, 12))
+        story.extend([obj_table, Spacer(1, 12)])
 
     # Strategic objectives narrative is now integrated into the table above
 
@@ -888,7 +1244,9 @@ def build_scorecard_pdf(
     # ─────────────────────────────────────────────────────────────────────
     production_summaries = ai_result.get("production_summaries", []) or []
     if production_summaries:
-        story.append(Paragraph("By Production / Programme", styles["SectionHeading"]))
+        story.append(_cached_paragraph("By Production / Programme", styles["SectionHeading"]))
+        sub_style = styles["SubHeading"]
+        body_style = styles["ReportBody"]
 
         for prod in production_summaries:
             if not isinstance(prod, dict):
@@ -896,7 +1254,7 @@ def build_scorecard_pdf(
 
             pname_raw = _to_plain_text(prod.get("production") or "General").strip() or "General"
             pname = _strip_objective_codes(pname_raw)
-            story.append(Paragraph(xml_escape(pname), styles["SubHeading"]))
+            story.append(Paragraph(xml_escape(pname), sub_style))
 
             # Handle both old "pillars" and new "objectives" structure
             objectives = prod.get("objectives") or prod.get("pillars") or []
@@ -904,61 +1262,57 @@ def build_scorecard_pdf(
             for obj in objectives:
                 if not isinstance(obj, dict):
                     continue
-                summary_text_raw = _to_plain_text(obj.get("summary", "")).strip()
-                summary_text = _strip_objective_codes(summary_text_raw)
+                summary_text = _clean_text(obj.get("summary", ""))
                 if summary_text:
                     summaries.append(summary_text)
 
             # Join with paragraph breaks to preserve structure, then split properly
             combined = "\n\n".join(summaries).strip()
             if combined:
-                combined_paras = _split_paragraphs(combined)
-                for p in combined_paras:
-                    story.append(_safe_paragraph(p, styles["ReportBody"]))
+                story.extend(_safe_paragraph(p, body_style) for p in _split_paragraphs(combined))
             else:
-                story.append(_safe_paragraph("No summary provided.", styles["ReportBody"]))
+                story.append(_safe_paragraph("No summary provided.", body_style))
 
             story.append(Spacer(1, 8))
 
     # ─────────────────────────────────────────────────────────────────────
     # Risks, priorities, notes
     # ─────────────────────────────────────────────────────────────────────
-    risks = [
-        _strip_objective_codes(_to_plain_text(r)).strip()
-        for r in (ai_result.get("risks", []) or [])
-        if _to_plain_text(r).strip()
-    ]
+    risks = list(_clean_strings(ai_result.get("risks")))
     if risks:
-        story.append(Paragraph("Key Risks / Concerns", styles["SectionHeading"]))
-        for r in risks:
-            story.append(_safe_paragraph(f"• {r}", styles["ReportBody"]))
+        story.append(_cached_paragraph("Key Risks / Concerns", styles["SectionHeading"]))
+        body_style = styles["ReportBody"]
+        story.extend(_safe_paragraph(f"• {r}", body_style) for r in risks)
 
-    priorities = [
-        _strip_objective_codes(_to_plain_text(p)).strip()
-        for p in (ai_result.get("priorities_next_month", []) or [])
-        if _to_plain_text(p).strip()
-    ]
+    priorities = list(_clean_strings(ai_result.get("priorities_next_month")))
     if priorities:
-        story.append(Spacer(1, 6))
-        story.append(Paragraph("Priorities for Next Period", styles["SectionHeading"]))
-        for p in priorities:
-            story.append(_safe_paragraph(f"• {p}", styles["ReportBody"]))
-
-    nfl_raw = _to_plain_text(ai_result.get("notes_for_leadership", "")).strip()
-    nfl = _strip_objective_codes(nfl_raw)
+        story.extend([
+            Spacer(1, 6),
+            _cached_paragraph("Priorities for Next Period", styles["SectionHeading"]),
+        ])
+        body_style = styles["ReportBody"]
+        story.extend(_safe_paragraph(f"• {p}", body_style) for p in priorities)
+
+    nfl = _clean_text(ai_result.get("notes_for_leadership", ""))
     if nfl:
-        story.append(Spacer(1, 6))
-        story.append(Paragraph("Notes for Leadership", styles["SectionHeading"]))
-        for p in _split_paragraphs(nfl):
-            story.append(_safe_paragraph(p, styles["ReportBody"]))
+        story.extend([
+            Spacer(1, 6),
+            _cached_paragraph("Notes for Leadership", styles["SectionHeading"]),
+        ])
+        body_style = styles["ReportBody"]
+        story.extend(_safe_paragraph(p, body_style) for p in _split_paragraphs(nfl))
 
     # ─────────────────────────────────────────────────────────────────────
     # Raw responses on a fresh page
     # ─────────────────────────────────────────────────────────────────────
-    story.append(PageBreak())
-    story.append(Paragraph("Raw Scorecard Responses", styles["SectionHeading"]))
-    story.append(Spacer(1, 6))
-    story.append(_responses_table(questions, responses, styles))
+    # Skipped when there are no questions: the table would be a lone header row
+    if not questions.empty:
+        story.extend([
+            PageBreak(),
+            _cached_paragraph("Raw Scorecard Responses", styles["SectionHeading"]),
+            Spacer(1, 6),
+            _responses_table(questions, responses, styles),
+        ])
 
     # ─────────────────────────────────────────────────────────────────────
     # Footer + metadata (JSON in Subject)
@@ -969,18 +1323,41 @@ def build_scorecard_pdf(
         width, height = doc_.pagesize
         canvas.drawString(36, 20, "Alberta Ballet — Scorecard Report")
         canvas.drawRightString(width - 36, 20, f"Page {doc_.page}")
+        canvas.restoreState()
 
+    # Metadata is document-wide, so set it once rather than on every page
+    def _first_page(canvas, doc_):
+        _footer(canvas, doc_)
         pdf_title = f"Strategic Summary Scorecard — {department}"
         canvas.setTitle(pdf_title)
         canvas.setAuthor(str(meta.get("staff_name") or ""))
         canvas.setSubject(JSON_PREFIX + embed_json_str)
 
-        canvas.restoreState()
+    doc.build(story, onFirstPage=_first_page, onLaterPages=_footer)
+
+
+def _build_scorecard_job(job: tuple) -> bytes:
+    return build_scorecard_pdf(*job)
+
+
+def build_scorecard_pdfs(
+    jobs: Iterable[tuple],
+    max_workers: int | None = None,
+) -> list[bytes]:
+    """
+    Build several scorecard PDFs in parallel, one worker process per core.
+
+    Each job is the positional arguments for build_scorecard_pdf:
+    (meta, questions, responses, ai_result[, logo_path[, kpi_explanations]]).
+    Results come back in job order. ReportLab layout holds the GIL, so
+    processes rather than threads are used; a single job skips the pool.
+    """
+    jobs = list(jobs)
+    if len(jobs) <= 1 or max_workers == 1:
+        return [_build_scorecard_job(job) for job in jobs]
+    with ProcessPoolExecutor(max_workers=max_workers) as executor:
+        return list(executor.map(_build_scorecard_job, jobs))
 
-    doc.build(story, onFirstPage=_footer, onLaterPages=_footer)
-    pdf_bytes = buffer.getvalue()
-    buffer.close()
-    return pdf_bytes
 
 def build_overall_board_pdf(
     reporting_label: str,
@@ -996,10 +1373,53 @@ def build_overall_board_pdf(
         ["department", "month_label", "overall_score"]
     - ai_result: the dict returned by interpret_overall_scorecards(...)
     """
+    # BytesIO.getvalue() hands back the internal buffer without copying it
+    return build_overall_board_pdf_stream(
+        reporting_label,
+        dept_overview,
+        ai_result,
+        logo_path=logo_path,
+    ).getvalue()
+
+
+def build_overall_board_pdf_stream(
+    reporting_label: str,
+    dept_overview: pd.DataFrame,
+    ai_result: Dict[str, Any],
+    logo_path: str | None = None,
+) -> BytesIO:
+    """
+    Build the Board PDF and return it as a BytesIO positioned at the start.
 
+    Same arguments as build_overall_board_pdf.
+    """
     buffer = BytesIO()
-    doc = SimpleDocTemplate(
+    render_overall_board_pdf(
         buffer,
+        reporting_label,
+        dept_overview,
+        ai_result,
+        logo_path=logo_path,
+    )
+    buffer.seek(0)
+    return buffer
+
+
+def render_overall_board_pdf(
+    fileobj: BinaryIO,
+    reporting_label: str,
+    dept_overview: pd.DataFrame,
+    ai_result: Dict[str, Any],
+    logo_path: str | None = None,
+) -> None:
+    """
+    Write the Board PDF into `fileobj` (any writable binary file object).
+
+    Use this to write straight to a file or response stream without an
+    intermediate in-memory copy. Same arguments as build_overall_board_pdf.
+    """
+    doc = SimpleDocTemplate(
+        fileobj,
         pagesize=LETTER,
         rightMargin=36,
         leftMargin=36,
@@ -1007,70 +1427,13 @@ def build_overall_board_pdf(
         bottomMargin=36,
     )
 
-    styles = getSampleStyleSheet()
-
-    # Match department scorecard typography
-    styles.add(
-        ParagraphStyle(
-            name="ScorecardTitle",
-            parent=styles["Title"],
-            fontName="Helvetica-Bold",
-            fontSize=22,
-            leading=26,
-            spaceAfter=4,
-        )
-    )
-    styles.add(
-        ParagraphStyle(
-            name="MetaLabel",
-            parent=styles["Normal"],
-            fontName="Helvetica",
-            textColor=colors.grey,
-            fontSize=9,
-            leading=11,
-            spaceAfter=1,
-        )
-    )
-    styles.add(
-        ParagraphStyle(
-            name="MetaValue",
-            parent=styles["BodyText"],
-            fontName="Helvetica",
-            fontSize=10,
-            leading=12,
-        )
-    )
-    styles.add(
-        ParagraphStyle(
-            name="SectionHeading",
-            parent=styles["Heading2"],
-            fontName="Helvetica-Bold",
-            fontSize=14,
-            spaceBefore=12,
-            spaceAfter=6,
-        )
-    )
-    styles.add(
-        ParagraphStyle(
-            name="ReportBody",
-            parent=styles["BodyText"],
-            fontName="Helvetica",
-            fontSize=10,
-            leading=13,
-        )
-    )
+    # Same typography as the department scorecard
+    styles = _report_styles()
 
     story: list[Flowable] = []
 
     # ── Header: logo + title (no reporting period in the table) ─────────────
-    logo_flowable: Flowable | None = None
-    if logo_path:
-        try:
-            img = Image(logo_path)
-            img._restrictSize(2 * inch, 2 * inch)
-            logo_flowable = img
-        except Exception:
-            logo_flowable = None
+    logo_flowable = _logo_image(logo_path)
 
     header_cells: list[Flowable] = []
     if logo_flowable:
@@ -1078,23 +1441,14 @@ def build_overall_board_pdf(
     else:
         header_cells.append(Spacer(0.5 * inch, 0.5 * inch))
 
-    header_cells.append(Paragraph("Strategic Summary Scorecard", styles["ScorecardTitle"]))
+    header_cells.append(_cached_paragraph("Strategic Summary Scorecard", styles["ScorecardTitle"]))
 
     # Two-column header: logo + title only, full width = 7.5"
     header_table = Table(
         [header_cells],
         colWidths=[2.0 * inch, 5.5 * inch],
         hAlign="LEFT",
-        style=TableStyle(
-            [
-                ("VALIGN", (0, 0), (-1, -1), "MIDDLE"),
-                ("LEFTPADDING", (0, 0), (0, 0), -4),
-                ("RIGHTPADDING", (0, 0), (0, 0), 6),
-                ("LEFTPADDING", (1, 0), (1, 0), 0),
-                ("RIGHTPADDING", (1, 0), (1, 0), 0),
-                ("BOTTOMPADDING", (0, 0), (-1, -1), 4),
-            ]
-        ),
+        style=_BOARD_HEADER_STYLE,
     )
 
     story.append(header_table)
@@ -1102,7 +1456,7 @@ def build_overall_board_pdf(
 
     # ── Reporting period: left-aligned, below header ────────────────────────
     if reporting_label:
-        story.append(Paragraph("REPORTING PERIOD", styles["MetaLabel"]))
+        story.append(_cached_paragraph("REPORTING PERIOD", styles["MetaLabel"]))
         story.append(Paragraph(str(reporting_label), styles["MetaValue"]))
         story.append(Spacer(1, 12))
 
@@ -1110,7 +1464,7 @@ def build_overall_board_pdf(
     # Departments overview table
     # ─────────────────────────────────────────────────────────────────────
     if not dept_overview.empty:
-        story.append(Paragraph("Departments included", styles["SectionHeading"]))
+        story.append(_cached_paragraph("Departments included", styles["SectionHeading"]))
         display_cols = ["department", "month_label", "overall_score"]
         display_cols = [c for c in display_cols if c in dept_overview.columns]
 
@@ -1118,26 +1472,14 @@ def build_overall_board_pdf(
             [col.replace("_", " ").title() for col in display_cols]
         ]
 
-        for _, row in dept_overview[display_cols].iterrows():
-            table_data.append([str(row.get(c, "")) for c in display_cols])
+        table_data.extend(
+            [str(v) for v in tup]
+            for tup in dept_overview[display_cols].itertuples(index=False, name=None)
+        )
 
         table = Table(
             table_data,
-            style=TableStyle(
-                [
-                    ("BACKGROUND", (0, 0), (-1, 0), colors.lightgrey),
-                    ("FONTNAME", (0, 0), (-1, 0), "Helvetica-Bold"),
-                    ("FONTSIZE", (0, 0), (-1, 0), 9),
-                    ("BOTTOMPADDING", (0, 0), (-1, 0), 4),
-                    ("ALIGN", (0, 0), (-1, 0), "LEFT"),
-
-                    ("FONTNAME", (0, 1), (-1, -1), "Helvetica"),
-                    ("FONTSIZE", (0, 1), (-1, -1), 9),
-                    ("VALIGN", (0, 1), (-1, -1), "TOP"),
-
-                    ("GRID", (0, 0), (-1, -1), 0.25, colors.grey),
-                ]
-            ),
+            style=_DEPT_OVERVIEW_STYLE,
             hAlign="LEFT",
         )
         story.append(table)
@@ -1146,18 +1488,17 @@ def build_overall_board_pdf(
     # ─────────────────────────────────────────────────────────────────────
     # Main Board narrative
     # ─────────────────────────────────────────────────────────────────────
-    story.append(Paragraph("Board Narrative", styles["SectionHeading"]))
+    story.append(_cached_paragraph("Board Narrative", styles["SectionHeading"]))
     overall_text = (ai_result.get("overall_summary") or "").strip()
 
     if not overall_text:
-        story.append(Paragraph("No Board report text was generated.", styles["ReportBody"]))
+        story.append(_cached_paragraph("No Board report text was generated.", styles["ReportBody"]))
     else:
-        text = overall_text.replace("\r\n", "\n")
-        parts = [p.strip() for p in text.split("\n\n") if p.strip()]
+        parts = [p.strip() for p in _PARA_SPLIT.split(overall_text) if p.strip()]
+        gap_style, body_style = styles["ReportBodyGap6"], styles["ReportBody"]
+        last = len(parts) - 1
         for idx, para in enumerate(parts):
-            story.append(Paragraph(para, styles["ReportBody"]))
-            if idx < len(parts) - 1:
-                story.append(Spacer(1, 6))
+            story.append(Paragraph(para, gap_style if idx < last else body_style))
 
     # ─────────────────────────────────────────────────────────────────────
     # Strategic Pillars Score Table (with embedded details)
@@ -1165,80 +1506,52 @@ def build_overall_board_pdf(
     pillar_summaries = ai_result.get("pillar_summaries", []) or []
     if pillar_summaries:
         story.append(Spacer(1, 12))
-        story.append(Paragraph("Strategic Pillars — Summary", styles["SectionHeading"]))
+        story.append(_cached_paragraph("Strategic Pillars — Summary", styles["SectionHeading"]))
         story.append(Spacer(1, 6))
         
+        body_style = styles["BodyText"]
+        details_style = styles["DetailsCell"]
+
         # Build table data with Details column (4 columns: Objective ID, Objective, Score, Details)
         table_data = [
             [
-                Paragraph("<b>Objective ID</b>", styles["BodyText"]),
-                Paragraph("<b>Objective</b>", styles["BodyText"]),
-                Paragraph("<b>Score</b>", styles["BodyText"]),
-                Paragraph("<b>Details</b>", styles["BodyText"]),
+                _cached_paragraph("<b>Objective ID</b>", body_style),
+                _cached_paragraph("<b>Objective</b>", body_style),
+                _cached_paragraph("<b>Score</b>", body_style),
+                _cached_paragraph("<b>Details</b>", body_style),
             ]
         ]
-        
-        for pillar_sum in pillar_summaries:
+
+        table_style_cmds = list(_SCORE_TABLE_STYLE_CMDS)
+
+        for i, pillar_sum in enumerate(pillar_summaries, start=1):
             # Use objective_id if available, otherwise leave blank
             obj_id = pillar_sum.get("objective_id", "") or ""
             pillar_name = pillar_sum.get("strategic_pillar", "Pillar") or "Pillar"
             score_hint_raw = _to_plain_text(pillar_sum.get("score_hint", "")).strip()
-            
-            # Parse score
+
+            # Parse score once; it drives both the cell text and its colour (column 2)
             score_value = _parse_score_hint(score_hint_raw)
             score_str = _score_display(score_value)
-            score_colour = _score_to_colour(score_value)
-            
+            table_style_cmds.append(("BACKGROUND", (2, i), (2, i), _score_to_colour(score_value)))
+            if score_value is not None and score_value >= 1.5:
+                table_style_cmds.append(("TEXTCOLOR", (2, i), (2, i), colors.white))
+
             # Get the summary text for the Details column
-            summary_text_raw = _to_plain_text(pillar_sum.get("summary", "")).strip()
-            summary_text = _strip_objective_codes(summary_text_raw)
+            summary_text = _clean_text(pillar_sum.get("summary", ""))
             if not summary_text:
                 summary_text = "No narrative summary provided for this pillar."
-            
-            # Use smaller font for details to fit better
-            details_style = ParagraphStyle(
-                name="DetailsCell",
-                parent=styles["BodyText"],
-                fontSize=8,
-                leading=10,
-            )
-            
-            # Create table row
-            obj_id_cell = Paragraph(xml_escape(obj_id or "—"), styles["BodyText"])
-            pillar_cell = Paragraph(xml_escape(pillar_name), styles["BodyText"])
-            score_cell = Paragraph(f"<b>{score_str} / 3</b>", styles["BodyText"])
-            details_cell = Paragraph(xml_escape(summary_text), details_style)
-            
-            table_data.append([obj_id_cell, pillar_cell, score_cell, details_cell])
-        
+
+            table_data.append([
+                Paragraph(xml_escape(obj_id or "—"), body_style),
+                Paragraph(xml_escape(pillar_name), body_style),
+                Paragraph(f"<b>{score_str} / 3</b>", body_style),
+                Paragraph(xml_escape(summary_text), details_style),
+            ])
+
         # Create table with colored score cells - wider to match left margin (7.5" usable width)
         # Adjusted widths: ID (0.7"), Objective (1.5"), Score (0.7"), Details (4.6")
-        pillar_table = Table(table_data, colWidths=[0.7*inch, 1.5*inch, 0.7*inch, 4.6*inch])
-        
-        table_style_cmds = [
-            ("BACKGROUND", (0, 0), (-1, 0), colors.lightgrey),
-            ("TEXTCOLOR", (0, 0), (-1, 0), colors.black),
-            ("FONTNAME", (0, 0), (-1, 0), "Helvetica-Bold"),
-            ("FONTSIZE", (0, 0), (-1, 0), 9),
-            ("ALIGN", (0, 0), (-1, -1), "LEFT"),
-            ("VALIGN", (0, 0), (-1, -1), "TOP"),
-            ("GRID", (0, 0), (-1, -1), 0.5, colors.grey),
-            ("LEFTPADDING", (0, 0), (-1, -1), 6),
-            ("RIGHTPADDING", (0, 0), (-1, -1), 6),
-            ("TOPPADDING", (0, 0), (-1, -1), 4),
-            ("BOTTOMPADDING", (0, 0), (-1, -1), 4),
-        ]
-        
-        # Add colored backgrounds for score column (now column 2)
-        for i in range(1, len(table_data)):
-            pillar_sum = pillar_summaries[i - 1]
-            score_hint_raw = _to_plain_text(pillar_sum.get("score_hint", "")).strip()
-            score_value = _parse_score_hint(score_hint_raw)
-            score_colour = _score_to_colour(score_value)
-            table_style_cmds.append(("BACKGROUND", (2, i), (2, i), score_colour))
-            if score_value is not None and score_value >= 1.5:
-                table_style_cmds.append(("TEXTCOLOR", (2, i), (2, i), colors.white))
-        
+        pillar_table = Table(table_data, colWidths=_PILLARS_COLWIDTHS)
         pillar_table.setStyle(TableStyle(table_style_cmds))
         story.append(pillar_table)
         story.append(Spacer(1, 12))
@@ -1249,28 +1562,30 @@ def build_overall_board_pdf(
     risks = ai_result.get("risks") or []
     if risks:
         story.append(Spacer(1, 10))
-        story.append(Paragraph("Strategic Pillar – Risks / Concerns", styles["SectionHeading"]))
+        story.append(_cached_paragraph("Strategic Pillar – Risks / Concerns", styles["SectionHeading"]))
+        body_style = styles["ReportBody"]
         for r in risks:
-            story.append(Paragraph(f"• {str(r)}", styles["ReportBody"]))
+            story.append(_cached_paragraph(f"• {str(r)}", body_style))
 
     # Organisation-wide priorities
     priorities = ai_result.get("priorities_next_month") or []
     if priorities:
         story.append(Spacer(1, 10))
-        story.append(Paragraph("Organization-wide Priorities for Next Period", styles["SectionHeading"]))
+        story.append(_cached_paragraph("Organization-wide Priorities for Next Period", styles["SectionHeading"]))
+        body_style = styles["ReportBody"]
         for p in priorities:
-            story.append(Paragraph(f"• {str(p)}", styles["ReportBody"]))
+            story.append(_cached_paragraph(f"• {str(p)}", body_style))
 
     # Notes for leadership
     notes = (ai_result.get("notes_for_leadership") or "").strip()
     if notes:
         story.append(Spacer(1, 10))
-        story.append(Paragraph("Notes for Leadership", styles["SectionHeading"]))
-        parts = [p.strip() for p in notes.replace("\r\n", "\n").split("\n\n") if p.strip()]
+        story.append(_cached_paragraph("Notes for Leadership", styles["SectionHeading"]))
+        parts = [p.strip() for p in _PARA_SPLIT.split(notes) if p.strip()]
+        gap_style, body_style = styles["ReportBodyGap4"], styles["ReportBody"]
+        last = len(parts) - 1
         for idx, para in enumerate(parts):
-            story.append(Paragraph(para, styles["ReportBody"]))
-            if idx < len(parts) - 1:
-                story.append(Spacer(1, 4))
+            story.append(Paragraph(para, gap_style if idx < last else body_style))
 
     # ─────────────────────────────────────────────────────────────────────
     # Appendix A — Strategic Objectives Index
@@ -1287,7 +1602,4 @@ def build_overall_board_pdf(
         canvas.restoreState()
 
     doc.build(story, onFirstPage=_footer, onLaterPages=_footer)
-    pdf_bytes = buffer.getvalue()
-    buffer.close()
-    return pdf_bytes
 
@@ -106,6 +106,25 @@ Q3,Question 3,,
         
         # Should not raise, just return None
         assert registry.get_question_text("anything") is None
+    
+    def test_from_csv_file_is_shared_until_file_changes(self, tmp_path):
+        """Test that from_csv_file reuses the parsed registry until the CSV changes."""
+        csv_path = tmp_path / "questions.csv"
+        csv_path.write_bytes(b"question_id,question_text\nQ1,First\n")
+        
+        first = QuestionRegistry.from_csv_file(csv_path)
+        assert QuestionRegistry.from_csv_file(csv_path) is first
+        assert first.get_question_text("Q1") == "First"
+        
+        csv_path.write_bytes(b"question_id,question_text\nQ1,First\nQ2,Second\n")
+        updated = QuestionRegistry.from_csv_file(csv_path)
+        assert updated is not first
+        assert updated.get_question_text("Q2") == "Second"
+    
+    def test_from_csv_file_missing(self, tmp_path):
+        """Test that a missing CSV gives an empty registry."""
+        registry = QuestionRegistry.from_csv_file(tmp_path / "missing.csv")
+        assert not registry.has_question("Q1")
 
 
 class TestHumanizeKey:
@@ -288,9 +307,7 @@ class TestIntegrationWithRealData:
         """Load the real community scorecard questions."""
         csv_path = Path(__file__).parent.parent / "data" / "community_scorecard_questions.csv"
         if csv_path.exists():
-            registry = QuestionRegistry()
-            registry.load_from_csv_file(csv_path)
-            return registry
+            return QuestionRegistry.from_csv_file(csv_path)
         pytest.skip("Community scorecard CSV not found")
     
     def test_comm_rec_q2a_with_real_data(self, real_registry):
@@ -0,0 +1,56 @@
+#!/usr/bin/env python3
+"""
+Benchmarks for merge_scorecards.
+
+Skipped unless pytest-benchmark is installed. Compare runs with
+`pytest tests/test_merge_benchmark.py --benchmark-autosave` and
+`--benchmark-compare` to catch merge-speed regressions.
+"""
+import json
+import sys
+from pathlib import Path
+
+# Add parent to path
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+import pytest
+
+pytest.importorskip("pytest_benchmark")
+
+from merge_scorecards import apply_conflict_resolutions, merge_scorecards, MergePolicy
+
+FIXTURES_DIR = Path(__file__).parent / "fixtures"
+
+
+def _load(name):
+    with open(FIXTURES_DIR / name) as f:
+        return json.load(f)
+
+
+def test_bench_merge_fixtures(benchmark):
+    """Merge the two user draft fixtures."""
+    drafts = [
+        (_load("user1_draft.json"), "user1_draft.json"),
+        (_load("user2_draft.json"), "user2_draft.json"),
+    ]
+    result = benchmark(merge_scorecards, drafts, policy=MergePolicy.NON_DEFAULT_WINS)
+    assert "ATI01" in result.merged_data["answers"]
+
+
+def test_bench_merge_and_resolve_conflicts(benchmark):
+    """Merge the conflicting fixtures and apply the first choice for each conflict."""
+    drafts = [
+        (_load("conflict_user1.json"), "conflict_user1.json"),
+        (_load("conflict_user2.json"), "conflict_user2.json"),
+    ]
+
+    def merge_and_resolve():
+        result = merge_scorecards(drafts, policy=MergePolicy.NON_DEFAULT_WINS)
+        resolutions = {i: 0 for i in range(len(result.conflicts))}
+        return apply_conflict_resolutions(result.merged_data, result.conflicts, resolutions)
+
+    assert benchmark(merge_and_resolve)["answers"]
+
+
+if __name__ == "__main__":
+    pytest.main([__file__, "-v"])
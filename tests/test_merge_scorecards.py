@@ -10,11 +10,14 @@ from pathlib import Path
 # Add parent to path
 sys.path.insert(0, str(Path(__file__).parent.parent))
 
+import copy
+
 from merge_scorecards import (
     merge_scorecards,
     MergePolicy,
     is_default_value,
     Conflict,
+    apply_conflict_resolutions,
 )
 
 
@@ -157,5 +160,53 @@ class TestNestedMerge:
         assert "Q3" in result.merged_data["per_show_answers"]["Artistic::Show2"]
 
 
+class TestApplyConflictResolutions:
+    """Test applying chosen values back onto the merged data."""
+    
+    def _merged(self):
+        return {
+            "answers": {"Q1": {"primary": "Yes"}, "Q2": {"primary": "Keep"}},
+            "per_show_answers": {
+                "Artistic::Show1": {"Q3": {"primary": "A"}},
+                "Artistic::Show2": {"Q4": {"primary": "B"}},
+            },
+            "meta": {"staff_name": "Pat"},
+        }
+    
+    def test_resolutions_applied_without_mutating_input(self):
+        merged = self._merged()
+        original = copy.deepcopy(merged)
+        conflicts = [
+            Conflict(section="answers.Q1", key="primary", values=[("Yes", "f1"), ("No", "f2")]),
+            Conflict(
+                section="per_show_answers.Artistic::Show1.Q3",
+                key="primary",
+                values=[("A", "f1"), ("C", "f2")],
+            ),
+            Conflict(section="meta", key="staff_name", values=[("Pat", "f1"), ("Sam", "f2")]),
+        ]
+        
+        resolved = apply_conflict_resolutions(merged, conflicts, {0: 1, 1: 1, 2: 1})
+        
+        assert resolved["answers"]["Q1"]["primary"] == "No"
+        assert resolved["per_show_answers"]["Artistic::Show1"]["Q3"]["primary"] == "C"
+        assert resolved["meta"]["staff_name"] == "Sam"
+        assert merged == original
+        # Untouched entries are carried over unchanged
+        assert resolved["answers"]["Q2"] == {"primary": "Keep"}
+        assert resolved["per_show_answers"]["Artistic::Show2"] == {"Q4": {"primary": "B"}}
+    
+    def test_missing_intermediate_keys_are_created(self):
+        merged = self._merged()
+        conflicts = [
+            Conflict(section="answers.Q9", key="primary", values=[("X", "f1"), ("Y", "f2")]),
+        ]
+        
+        resolved = apply_conflict_resolutions(merged, conflicts, {0: 0})
+        
+        assert resolved["answers"]["Q9"] == {"primary": "X"}
+        assert "Q9" not in merged["answers"]
+
+
 if __name__ == "__main__":
     pytest.main([__file__, "-v"])
@@ -0,0 +1,179 @@
+#!/usr/bin/env python3
+"""
+Tests for the PDF helper functions in pdf_utils.
+
+Covers the pure helpers used while building the scorecard and Board PDFs;
+the ReportLab layout itself is not exercised here.
+"""
+import sys
+from io import BytesIO
+from pathlib import Path
+
+# Add parent to path
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+import pandas as pd
+import pytest
+from PyPDF2 import PdfReader
+from pdf_utils import (
+    _format_response,
+    _logo_image,
+    _parse_score_hint,
+    _strip_objective_codes,
+    _to_plain_text,
+    build_scorecard_pdfs,
+)
+
+
+class TestParseScoreHint:
+    """Tests for _parse_score_hint, which maps AI score hints onto 0–3."""
+
+    @pytest.mark.parametrize(
+        "hint, expected",
+        [
+            ("2/3 Steady progress", 2.0),
+            ("1.5 / 3", 1.5),
+            ("On track 3 / 3", 3.0),
+            ("4/4", 3.0),
+            ("Score: 2.5", 2.5),
+            ("7", 3.0),
+        ],
+    )
+    def test_fraction_and_bare_number(self, hint, expected):
+        """Fractions are rescaled to 0–3; bare numbers are clamped."""
+        assert _parse_score_hint(hint) == pytest.approx(expected)
+
+    def test_first_fraction_wins_over_earlier_number(self):
+        """A fraction anywhere in the text takes priority over a leading number."""
+        assert _parse_score_hint("Goal 1: 2/4 complete") == pytest.approx(1.5)
+
+    def test_zero_denominator_falls_back_to_first_number(self):
+        """A x/0 fraction is ignored and the first number is used instead."""
+        assert _parse_score_hint("2/0 then 1") == pytest.approx(2.0)
+
+    def test_fraction_may_start_mid_number(self):
+        """Matching follows regex search semantics, including mid-token starts."""
+        # "0.1.2/4" reads as 1.2/4, not 2/4
+        assert _parse_score_hint("0.1.2/4") == pytest.approx(0.9)
+
+    @pytest.mark.parametrize("hint", [None, "", "no score yet", 0, True, float("nan")])
+    def test_unparseable_returns_none(self, hint):
+        """Empty, non-numeric, boolean and NaN hints have no score."""
+        assert _parse_score_hint(hint) is None
+
+    @pytest.mark.parametrize("hint, expected", [(2, 2.0), (2.5, 2.5), (4, 3.0), (-1, 0.0)])
+    def test_numeric_hint_is_clamped(self, hint, expected):
+        """Numeric hints are used directly and clamped to 0–3."""
+        assert _parse_score_hint(hint) == pytest.approx(expected)
+
+
+class TestStripObjectiveCodes:
+    """Tests for _strip_objective_codes, which hides internal ART codes."""
+
+    @pytest.mark.parametrize(
+        "text, expected",
+        [
+            ("ART1: Elevate artistic excellence", "Elevate artistic excellence"),
+            ("(ART2): Grow audiences", "Grow audiences"),
+            ("Grow audiences (ART2) and donors", "Grow audiences and donors"),
+            ("Link to ART3 and ART14", "Link to and"),
+            ("Tour – regional  venues", "Tour regional venues"),
+            ("ARTISTIC growth", "ARTISTIC growth"),
+            ("", ""),
+        ],
+    )
+    def test_strip(self, text, expected):
+        """Codes are removed and leftover whitespace is collapsed."""
+        assert _strip_objective_codes(text) == expected
+
+
+class TestFormatResponse:
+    """Tests for rendering {"primary", "description"} response dicts."""
+
+    def test_primary_and_description(self):
+        """Both parts present are joined with an em dash."""
+        assert _format_response({"primary": "Yes", "description": "Sold out"}) == "Yes — Sold out"
+
+    def test_non_str_description_joined(self):
+        """A non-str description is stringified before joining."""
+        assert _format_response({"primary": "Yes", "description": 2}) == "Yes — 2"
+
+    @pytest.mark.parametrize("desc, expected", [
+        (5, "5"),
+        (["a", "b"], "['a', 'b']"),
+    ])
+    def test_non_str_description_alone(self, desc, expected):
+        """A description without a primary still comes back as a str."""
+        raw = {"primary": "", "description": desc}
+        assert _format_response(raw) == expected
+        assert _to_plain_text(raw) == expected
+
+
+class TestToPlainText:
+    """Tests for _to_plain_text on dict-valued AI fields."""
+
+    @pytest.mark.parametrize("value, expected", [
+        (float("nan"), "NaN"),
+        (float("inf"), "Infinity"),
+        (None, "null"),
+    ])
+    def test_non_finite_floats_match_json(self, value, expected):
+        """Non-finite floats render as json.dumps does, not as null."""
+        assert _to_plain_text({"a": value}) == f'{{\n  "a": {expected}\n}}'
+
+
+class TestLogoImage:
+    """Tests for _logo_image and its cached file read."""
+
+    LOGO = Path(__file__).parent.parent / "assets" / "alberta_ballet_logo.png"
+
+    def test_missing_or_empty_path(self, tmp_path):
+        """No path, or a path that cannot be read, gives no logo."""
+        assert _logo_image(None) is None
+        assert _logo_image("") is None
+        assert _logo_image(str(tmp_path / "missing.png")) is None
+
+    def test_replaced_file_is_reloaded(self, tmp_path):
+        """A logo rewritten in place, even within one mtime tick, is re-read."""
+        logo = tmp_path / "logo.png"
+        logo.write_bytes(b"not an image")
+        assert _logo_image(str(logo)) is None
+
+        logo.write_bytes(self.LOGO.read_bytes())
+        assert _logo_image(str(logo)) is not None
+
+
+class TestBuildScorecardPdfs:
+    """Tests for build_scorecard_pdfs, the batch (multi-process) builder."""
+
+    @staticmethod
+    def _jobs():
+        questions = pd.DataFrame([{
+            "question_id": "Q1",
+            "display_order": 1,
+            "strategic_pillar": "Artistic",
+            "metric": "Attendance",
+            "question_text": "How many attended?",
+        }])
+        return [
+            ({"department": dept}, questions, {"Q1": "120"}, {})
+            for dept in ("Artistic", "Marketing")
+        ]
+
+    @pytest.mark.parametrize("max_workers", [1, 2])
+    def test_results_in_job_order(self, max_workers):
+        """Both the inline and the process-pool paths keep job order."""
+        results = build_scorecard_pdfs(self._jobs(), max_workers=max_workers)
+        assert len(results) == 2
+        titles = []
+        for pdf in results:
+            assert pdf.startswith(b"%PDF")
+            titles.append(PdfReader(BytesIO(pdf)).metadata.title)
+        assert titles == [
+            "Strategic Summary Scorecard — Artistic",
+            "Strategic Summary Scorecard — Marketing",
+        ]
+
+
+if __name__ == "__main__":
+    pytest.main([__file__, "-v"])
@@ -22,6 +22,14 @@ def _hash_bytes(b: bytes) -> str:
     return hashlib.sha256(b).hexdigest()
 
 
+def _hash_chunks(chunks) -> str:
+    """Chunked hash mirroring the one in app.py (used for multi-file uploads)."""
+    h = hashlib.sha256()
+    for chunk in chunks:
+        h.update(chunk)
+    return h.hexdigest()
+
+
 def test_hash_calculation_consistent():
     """Test that hash calculation is consistent for the same content."""
     content1 = b'{"test": "data"}'
@@ -58,6 +66,18 @@ def test_combined_file_hash():
     print("✅ Combined file hash is order-dependent and consistent")
 
 
+def test_chunked_hash_matches_joined_hash():
+    """Test that hashing files chunk by chunk matches hashing their concatenation."""
+    file1 = b'{"user": "alice"}'
+    file2 = b'{"user": "bob"}'
+    
+    # Keeps hashes recorded before the chunked version valid
+    assert _hash_chunks([file1, file2]) == _hash_bytes(b"".join([file1, file2]))
+    assert _hash_chunks([]) == _hash_bytes(b"")
+    
+    print("✅ Chunked hash matches joined hash")
+
+
 def test_empty_files_handled():
     """Test that empty files don't cause hash issues."""
     empty = b''
@@ -99,8 +119,9 @@ def test_fixture_files_have_distinct_hashes():
     hash2 = _hash_bytes(user2_content)
     assert hash1 != hash2, "Fixture files should have different content"
     
-    # Combined hash should be different from either individual
-    combined = _hash_bytes(b"".join([user1_content, user2_content]))
+    # Combined hash (as app.py computes it for multi-file uploads) should be
+    # different from either individual
+    combined = _hash_chunks([user1_content, user2_content])
     assert combined != hash1
     assert combined != hash2
     
@@ -114,6 +135,7 @@ if __name__ == "__main__":
     
     test_hash_calculation_consistent()
     test_combined_file_hash()
+    test_chunked_hash_matches_joined_hash()
     test_empty_files_handled()
     test_fixture_files_have_distinct_hashes()
     